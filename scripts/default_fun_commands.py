@@ -4,7 +4,7 @@ import re
 import os
 import logging
 import importlib.util # For checking pyfiglet availability
-from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable, Tuple
 from tirc_core.scripting.script_base import ScriptBase
 
 if TYPE_CHECKING:
@@ -13,12 +13,46 @@ if TYPE_CHECKING:
 # Use a logger specific to this script for better traceability
 script_logger = logging.getLogger("tirc.scripts.default_fun_commands")
 
+# NdN dice notation; matched against the whole argument so trailing junk like "2d6xyz" is rejected
+_DICE_RE = re.compile(r"(\d+)d(\d+)")
+
+# Largest die rolled with random.choices; its float-based index has negligible bias up to here
+_MAX_CHOICES_SIDES = 2**32
+
+_RAINBOW_COLORS = ("red", "orange", "yellow", "green", "blue", "indigo", "violet")
+
+# Fallbacks used when the script's data files are missing or empty
+_DEFAULT_SLAP_ITEMS = ("a large trout", "a wet noodle", "a rubber chicken")
+_DEFAULT_EIGHT_BALL_ANSWERS = (
+    "It is certain.",
+    "It is decidedly so.",
+    "Without a doubt.",
+    "Yes – definitely.",
+    "You may rely on it.",
+    "As I see it, yes.",
+    "Most likely.",
+    "Outlook good.",
+    "Yes.",
+    "Signs point to yes.",
+    "Reply hazy, try again.",
+    "Ask again later.",
+    "Better not tell you now.",
+    "Cannot predict now.",
+    "Concentrate and ask again.",
+    "Don't count on it.",
+    "My reply is no.",
+    "My sources say no.",
+    "Outlook not so good.",
+    "Very doubtful.",
+)
+
 
 class FunCommandsScript(ScriptBase):
     def __init__(self, api_handler: "ScriptAPIHandler"):
         super().__init__(api_handler)
-        self.slap_items: List[str] = []
-        self.eight_ball_answers: List[str] = []
+        self.slap_items: Tuple[str, ...] = ()
+        self.eight_ball_answers: Tuple[str, ...] = ()
+        self._figlet: Optional[Any] = None  # pyfiglet.Figlet, built on first /ascii and reused
 
         # Check for pyfiglet availability without importing it globally at init
         if importlib.util.find_spec("pyfiglet"):
@@ -30,33 +64,11 @@ class FunCommandsScript(ScriptBase):
 
     async def load(self): # Changed to async
         self.api.log_info("FunCommandsScript loading data...")
-        self.slap_items = await self.load_list_from_data_file( # Added await
-            "slap_items.txt", ["a large trout", "a wet noodle", "a rubber chicken"]
+        self.slap_items = tuple(
+            await self.load_list_from_data_file("slap_items.txt", _DEFAULT_SLAP_ITEMS)
         )
-        self.eight_ball_answers = await self.load_list_from_data_file( # Added await
-            "magic_eight_ball_answers.txt",
-            [
-                "It is certain.",
-                "It is decidedly so.",
-                "Without a doubt.",
-                "Yes – definitely.",
-                "You may rely on it.",
-                "As I see it, yes.",
-                "Most likely.",
-                "Outlook good.",
-                "Yes.",
-                "Signs point to yes.",
-                "Reply hazy, try again.",
-                "Ask again later.",
-                "Better not tell you now.",
-                "Cannot predict now.",
-                "Concentrate and ask again.",
-                "Don't count on it.",
-                "My reply is no.",
-                "My sources say no.",
-                "Outlook not so good.",
-                "Very doubtful.",
-            ],
+        self.eight_ball_answers = tuple(
+            await self.load_list_from_data_file("magic_eight_ball_answers.txt", _DEFAULT_EIGHT_BALL_ANSWERS)
         )
 
         if not self.pyfiglet_available:
@@ -116,11 +128,10 @@ class FunCommandsScript(ScriptBase):
 
     async def handle_8ball_command(self, args_str: str, event_data: Dict[str, Any]):
         """Handle the /8ball command"""
-        parts = await self.ensure_command_args(args_str, "8ball", 1)
-        if not parts:
+        question = await self.ensure_command_args_raw(args_str, "8ball", 1)
+        if not question:
             return
 
-        question = " ".join(parts)
         answer = random.choice(self.eight_ball_answers)
         await self.api.add_message_to_context(
             event_data.get("active_context_name", "Status"),
@@ -135,7 +146,7 @@ class FunCommandsScript(ScriptBase):
             return
 
         dice_str = parts[0]
-        match = re.match(r"(\d+)d(\d+)", dice_str)
+        match = _DICE_RE.fullmatch(dice_str)
         if not match:
             await self.api.add_message_to_context(
                 event_data.get("active_context_name", "Status"),
@@ -155,7 +166,11 @@ class FunCommandsScript(ScriptBase):
             )
             return
 
-        rolls = [random.randint(1, sides) for _ in range(num_dice)]
+        if sides <= _MAX_CHOICES_SIDES:
+            rolls = random.choices(range(1, sides + 1), k=num_dice)
+        else:
+            # choices() scales a 53-bit float, which stops being uniform for huge dice; randint stays exact
+            rolls = [random.randint(1, sides) for _ in range(num_dice)]
         total = sum(rolls)
         await self.api.add_message_to_context(
             event_data.get("active_context_name", "Status"),
@@ -165,16 +180,15 @@ class FunCommandsScript(ScriptBase):
 
     async def handle_rainbow_command(self, args_str: str, event_data: Dict[str, Any]):
         """Handle the /rainbow command"""
-        parts = await self.ensure_command_args(args_str, "rainbow", 1)
-        if not parts:
+        text = await self.ensure_command_args_raw(args_str, "rainbow", 1)
+        if not text:
             return
 
-        text = " ".join(parts)
-        colors = ["red", "orange", "yellow", "green", "blue", "indigo", "violet"]
-        rainbow_text = ""
-        for i, char in enumerate(text):
-            color = colors[i % len(colors)]
-            rainbow_text += f"\x03{color}{char}"
+        colors = _RAINBOW_COLORS
+        num_colors = len(colors)
+        rainbow_text = "".join(
+            f"\x03{colors[i % num_colors]}{char}" for i, char in enumerate(text)
+        )
         rainbow_text += "\x03"  # Reset color
 
         await self.api.add_message_to_context(
@@ -183,11 +197,10 @@ class FunCommandsScript(ScriptBase):
 
     async def handle_reverse_command(self, args_str: str, event_data: Dict[str, Any]):
         """Handle the /reverse command"""
-        parts = await self.ensure_command_args(args_str, "reverse", 1)
-        if not parts:
+        text = await self.ensure_command_args_raw(args_str, "reverse", 1)
+        if not text:
             return
 
-        text = " ".join(parts)
         reversed_text = text[::-1]
         await self.api.add_message_to_context(
             event_data.get("active_context_name", "Status"), reversed_text, "system"
@@ -195,17 +208,21 @@ class FunCommandsScript(ScriptBase):
 
     async def handle_wave_command(self, args_str: str, event_data: Dict[str, Any]):
         """Handle the /wave command"""
-        parts = await self.ensure_command_args(args_str, "wave", 1)
-        if not parts:
+        text = await self.ensure_command_args_raw(args_str, "wave", 1)
+        if not text:
             return
 
-        text = " ".join(parts)
-        wave_text = ""
-        for i, char in enumerate(text):
-            if i % 2 == 0:
-                wave_text += char.upper()
-            else:
-                wave_text += char.lower()
+        if text.isascii():
+            # ASCII case mapping is one-to-one, so alternate bytes can be cased a slice at a time
+            wave_bytes = bytearray(text.encode("ascii"))
+            wave_bytes[::2] = wave_bytes[::2].upper()
+            wave_bytes[1::2] = wave_bytes[1::2].lower()
+            wave_text = wave_bytes.decode("ascii")
+        else:
+            # Non-ASCII case mapping can change length (e.g. "ß" -> "SS"), so go character by character
+            wave_text = "".join(
+                char.upper() if i % 2 == 0 else char.lower() for i, char in enumerate(text)
+            )
         await self.api.add_message_to_context(
             event_data.get("active_context_name", "Status"), wave_text, "system"
         )
@@ -220,19 +237,19 @@ class FunCommandsScript(ScriptBase):
             )
             return
 
-        parts = await self.ensure_command_args(args_str, "ascii", 1)
-        if not parts:
+        text = await self.ensure_command_args_raw(args_str, "ascii", 1)
+        if not text:
             return
 
-        text = " ".join(parts)
         try:
-            # Import pyfiglet here, only when the command is used
-            import pyfiglet
-            ascii_art = pyfiglet.figlet_format(text)
-            for line in ascii_art.split("\n"):
-                await self.api.add_message_to_context(
-                    event_data.get("active_context_name", "Status"), line, "system"
-                )
+            if self._figlet is None:
+                # Import pyfiglet here, only when the command is first used; the Figlet keeps its parsed font
+                import pyfiglet
+                self._figlet = pyfiglet.Figlet()
+            ascii_art = self._figlet.renderText(text)
+            await self.api.add_messages_to_context(
+                event_data.get("active_context_name", "Status"), ascii_art.split("\n"), "system"
+            )
         except Exception as e:
             await self.api.add_message_to_context(
                 event_data.get("active_context_name", "Status"),
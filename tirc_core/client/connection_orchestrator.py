@@ -140,7 +140,6 @@ class ConnectionOrchestrator:
 
         # Clear other relevant client state stored in ConnectionInfo
         if conn_info:
-            conn_info.currently_joined_channels.clear()
             conn_info.user_modes.clear() # Also reset user modes
             conn_info.last_attempted_nick_change = None # Reset last attempted nick
             # Do not clear last_error, connection_attempts, etc. here as they might be relevant
@@ -149,6 +148,7 @@ class ConnectionOrchestrator:
             await self.state_manager.set_connection_info(conn_info) # Save changes to ConnectionInfo
 
         client.last_join_command_target = None # This is specific to client logic flow
+        client._list_target_context = None # Drop any /list target cached by an interrupted LIST
 
         # If a /server switch is pending and waiting for disconnect, signal it
         if client._server_switch_disconnect_event and not client._server_switch_disconnect_event.is_set():
@@ -38,7 +38,7 @@ from tirc_core.commands.command_handler import CommandHandler
 from tirc_core.client.input_handler import InputHandler
 from tirc_core.features.triggers.trigger_manager import TriggerManager, ActionType
 from tirc_core.irc import irc_protocol
-from tirc_core.irc.irc_message import IRCMessage
+from tirc_core.irc.irc_message import IRCMessage, irc_casefold
 from tirc_core.irc.cap_negotiator import CapNegotiator
 from tirc_core.irc.sasl_authenticator import SaslAuthenticator
 from tirc_core.irc.registration_handler import RegistrationHandler
@@ -71,9 +71,12 @@ class IRCClient_Logic:
         self.show_raw_log_in_ui: bool = False
         self.last_join_command_target: Optional[str] = None
         self.active_list_context_name: Optional[str] = None
+        self._list_target_context: Optional[Tuple[Optional[str], str]] = None # (active_list_context_name, resolved target) for the current /list
+        self._numeric_dispatcher: Optional[Any] = None # irc_numeric_handlers.NumericDispatcher, built on the first numeric
         self._final_quit_message: Optional[str] = None
         self.max_reconnect_delay: float = 300.0
-        self.last_attempted_nick_change: Optional[str] = None
+        self._last_attempted_nick_change: Optional[str] = None
+        self._last_attempted_nick_change_folded: Optional[str] = None # irc_casefold() of the above, kept in sync by its setter
         self._executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
 
         self._network_task_ref: Optional[asyncio.Task] = None
@@ -347,6 +350,20 @@ class IRCClient_Logic:
                 logger.error(f"Error unloading script {script_name}: {e}", exc_info=True)
         logger.info("All scripts unloaded.")
 
+    @property
+    def last_attempted_nick_change(self) -> Optional[str]:
+        return self._last_attempted_nick_change
+
+    @last_attempted_nick_change.setter
+    def last_attempted_nick_change(self, value: Optional[str]):
+        self._last_attempted_nick_change = value
+        self._last_attempted_nick_change_folded = irc_casefold(value) if value is not None else None
+
+    @property
+    def last_attempted_nick_change_folded(self) -> Optional[str]:
+        """RFC 1459 casefolded form of last_attempted_nick_change, for comparing against nicks in server replies."""
+        return self._last_attempted_nick_change_folded
+
     @property
     def nick(self) -> Optional[str]:
         info = self.state_manager.get_connection_info()
@@ -422,11 +439,18 @@ class IRCClient_Logic:
             timestamp = time.strftime("%H:%M:%S")
             final_text = f"[{timestamp}] {text}"
 
-        logger.debug(f"IRCClient_Logic.add_message: Adding to context='{context_name}', text='{final_text[:100]}...', color_pair_id={color_pair_id}, kwargs={kwargs}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"IRCClient_Logic.add_message: Adding to context='{context_name}', text='{final_text[:100]}...', color_pair_id={color_pair_id}, kwargs={kwargs}")
         self.context_manager.add_message_to_context(context_name=context_name, text_line=final_text, color_pair_id=color_pair_id, **kwargs)
         if self.ui: self.ui_needs_update.set()
         else: logger.info(f"[Message to {context_name}] {text}")
 
+    async def add_messages(self, lines: List[str], color_pair_id: int, context_name: str):
+        """Adds several lines to a context and requests a single UI refresh for all of them."""
+        self.context_manager.add_messages_to_context(context_name, lines, color_pair_id)
+        if self.ui: self.ui_needs_update.set()
+        else: logger.info(f"[Messages to {context_name}] " + " | ".join(lines))
+
     async def add_status_message(self, text: str, color_key: str = "system"):
         color_pair_id = self.ui.colors.get(color_key, self.ui.colors.get("system", 0)) if self.ui and hasattr(self.ui, 'colors') else 0
         await self.add_message(text, color_pair_id, "Status", prefix_time=False)
@@ -505,6 +529,5 @@ class IRCClient_Logic:
             self._pending_initial_joins_internal.remove(normalized_channel_name)
             if not self._pending_initial_joins_internal:
                 self.all_initial_joins_processed.set()
-        if hasattr(self, "event_manager") and self.event_manager:
-            await self.event_manager.dispatch_event("CHANNEL_FULLY_JOINED", {"channel_name": channel_name, "client_nick": self.nick})
+        await self.event_manager.dispatch_event("CHANNEL_FULLY_JOINED", {"channel_name": channel_name, "client_nick": self.nick})
         self.ui_needs_update.set()
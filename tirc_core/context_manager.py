@@ -9,11 +9,16 @@ from typing import (
     Dict,
     List,
     Set,
+    Iterable,
+    Union,
 )
 
 
 logger = logging.getLogger("tirc.context")
 
+# First characters that mark a context name as a channel (channel names are case-insensitive).
+_CHANNEL_PREFIX_CHARS = frozenset("#&!+")
+
 
 class ChannelJoinStatus(Enum):
     NOT_JOINED = auto()
@@ -60,6 +65,10 @@ class Context:
     def add_message(self, text: str, color_pair_id: int):
         self.messages.append((text, color_pair_id))
 
+    def add_messages(self, lines: List[str], color_pair_id: int):
+        """Bulk form of add_message: appends every line with the same color."""
+        self.messages.extend([(text, color_pair_id) for text in lines])
+
     def __repr__(self):
         user_count = len(self.users)
         join_status_repr = (
@@ -109,7 +118,7 @@ class ContextManager:
     def _normalize_context_name(self, name: str) -> str:
         if not name:
             return ""
-        if name.startswith(("#", "&", "!", "+")):
+        if name[0] in _CHANNEL_PREFIX_CHARS:
             return name.lower()
         return name
 
@@ -238,6 +247,14 @@ class ContextManager:
                 channels.add(name)
         return channels
 
+    def get_joined_channels(self) -> Set[str]:
+        """Returns the names of channels whose join has completed (FULLY_JOINED)."""
+        return {
+            context.name
+            for context in self.contexts.values()
+            if context.type == "channel" and context.join_status is ChannelJoinStatus.FULLY_JOINED
+        }
+
     def add_message_to_context(
         self,
         context_name: str,
@@ -246,7 +263,8 @@ class ContextManager:
         num_lines_added: int = 1,
         **kwargs, # Add **kwargs to accept and ignore extra arguments
     ):
-        logger.debug(f"add_message_to_context called for '{context_name}'. Current contexts: {list(self.contexts.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"add_message_to_context called for '{context_name}'. Current contexts: {list(self.contexts.keys())}")
         original_passed_name = context_name
         normalized_name = self._normalize_context_name(context_name)
         context = self.contexts.get(normalized_name)
@@ -262,6 +280,25 @@ class ContextManager:
         if self.active_context_name != normalized_name:
             context.unread_count += num_lines_added
 
+    def add_messages_to_context(
+        self, context_name: str, text_lines: List[str], color_pair_id: int
+    ) -> int:
+        """Appends several lines to a context with a single lookup.
+        Returns the number of lines added (0 if the context does not exist)."""
+        normalized_name = self._normalize_context_name(context_name)
+        context = self.contexts.get(normalized_name)
+        if not context:
+            logger.error(
+                f"Attempted to add messages to non-existent context: '{normalized_name}' (original: '{context_name}')"
+            )
+            return 0
+
+        context.add_messages(text_lines, color_pair_id)
+
+        if self.active_context_name != normalized_name:
+            context.unread_count += len(text_lines)
+        return len(text_lines)
+
     def update_topic(self, context_name: str, topic: str) -> bool:
         original_passed_name = context_name
         normalized_name = self._normalize_context_name(context_name)
@@ -299,6 +336,33 @@ class ContextManager:
             )
         return False
 
+    def add_users(
+        self, context_name: str, users: Union[Dict[str, str], Iterable[Tuple[str, str]]]
+    ) -> int:
+        """Adds or updates many users in a context with a single lookup and one dict.update.
+        users is a user -> prefix dict (fastest) or an iterable of (user, prefix) pairs.
+        Returns the number of users that were not already present."""
+        normalized_name = self._normalize_context_name(context_name)
+        context = self.contexts.get(normalized_name)
+        if not context:
+            logger.warning(
+                f"Failed to add users to non-existent context: '{normalized_name}' (original: '{context_name}')"
+            )
+            return 0
+        if context.type not in ["channel", "query"]:
+            logger.debug(
+                f"Not adding users to context '{context.name}' (type '{context.type}') (original passed: '{context_name}')"
+            )
+            return 0
+        users_dict = context.users
+        count_before = len(users_dict)
+        users_dict.update(users)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Added/updated users in context '{context.name}' ({count_before} -> {len(users_dict)} entries)"
+            )
+        return len(users_dict) - count_before
+
     def remove_user(self, context_name: str, user: str) -> bool:
         """Removes a user from a context."""
         original_passed_name = context_name
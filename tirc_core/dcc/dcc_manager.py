@@ -3,14 +3,15 @@ import logging
 import asyncio
 import threading # For self._lock
 import time # For generating unique transfer IDs
+from bisect import insort
 from typing import TYPE_CHECKING, Dict, Optional, List, Any, Union
 from pathlib import Path
 
-from tirc_core.dcc.dcc_transfer import DCCTransfer, DCCTransferStatus, DCCTransferType
+from tirc_core.dcc.dcc_transfer import DCCTransfer, DCCTransferStatus, DCCTransferType, TERMINAL_STATUSES
 from tirc_core.dcc.dcc_send_manager import DCCSendManager, DCCSendTransfer
 from tirc_core.dcc.dcc_receive_manager import DCCReceiveManager, DCCReceiveTransfer
 from tirc_core.dcc.dcc_passive_offer_manager import DCCPassiveOfferManager
-from tirc_core.dcc.dcc_utils import get_local_ip_for_ctcp, parse_dcc_ctcp
+from tirc_core.dcc.dcc_utils import get_local_ip_for_ctcp, parse_dcc_ctcp, keys_with_prefix, discard_sorted_key
 from tirc_core.dcc.dcc_security import sanitize_filename
 from tirc_core.config_defs import DccConfig
 
@@ -20,6 +21,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("tirc.dcc.manager")
 
+
+def _transfer_start_time_key(transfer: DCCTransfer) -> float:
+    return transfer.start_time or float('-inf')
+
 class DCCManager:
     def __init__(self, client_logic_ref: "IRCClient_Logic", event_manager_ref: "EventManager"):
         self.client_logic = client_logic_ref
@@ -28,6 +33,7 @@ class DCCManager:
         self.dcc_config: DccConfig = self._load_dcc_config()
 
         self.transfers: Dict[str, DCCTransfer] = {}
+        self._sorted_transfer_ids: List[str] = [] # Sorted mirror of transfers keys for prefix lookups
         self._lock = threading.Lock()
 
         self.dcc_event_logger = logging.getLogger("tirc.dcc.events")
@@ -72,6 +78,8 @@ class DCCManager:
 
     def _add_transfer_to_tracking(self, transfer: DCCTransfer):
         with self._lock:
+            if transfer.id not in self.transfers:
+                insort(self._sorted_transfer_ids, transfer.id)
             self.transfers[transfer.id] = transfer
         logger.info(f"Tracking new DCC transfer: {transfer.id} ({transfer.filename})")
         asyncio.create_task(self.dispatch_transfer_event("DCC_TRANSFER_INITIATED", transfer))
@@ -81,9 +89,8 @@ class DCCManager:
         if additional_data:
             event_payload.update(additional_data)
         await self.event_manager.dispatch_event(event_name, event_payload)
-        self.dcc_event_logger.info(f"Dispatched event {event_name} for transfer {transfer.id} ({transfer.filename}). Status: {transfer.status.name}")
-        if event_name == "DCC_TRANSFER_STATUS_CHANGE" and \
-           transfer.status in [DCCTransferStatus.COMPLETED, DCCTransferStatus.FAILED, DCCTransferStatus.CANCELLED]:
+        self.dcc_event_logger.info("Dispatched event %s for transfer %s (%s). Status: %s", event_name, transfer.id, transfer.filename, transfer.status)
+        if event_name == "DCC_TRANSFER_STATUS_CHANGE" and transfer.status in TERMINAL_STATUSES:
             if isinstance(transfer, DCCSendTransfer) and self.send_manager:
                 await self.send_manager.handle_transfer_completion(transfer)
 
@@ -215,8 +222,9 @@ class DCCManager:
 
     def find_resumable_send_transfer(self, identifier: str) -> Optional[DCCSendTransfer]:
         with self._lock:
-            for t_id, transfer_obj in self.transfers.items():
-                if isinstance(transfer_obj, DCCSendTransfer) and t_id.startswith(identifier):
+            for t_id in keys_with_prefix(self._sorted_transfer_ids, identifier):
+                transfer_obj = self.transfers[t_id]
+                if isinstance(transfer_obj, DCCSendTransfer):
                     if transfer_obj.status in [DCCTransferStatus.FAILED, DCCTransferStatus.CANCELLED, DCCTransferStatus.PAUSED]:
                         return transfer_obj
             for transfer_obj in self.transfers.values():
@@ -227,20 +235,21 @@ class DCCManager:
 
     async def cancel_transfer_by_id_or_token(self, id_or_token_prefix: str, reason: str = "Cancelled by user command") -> bool:
         with self._lock:
-            for transfer_id, transfer_obj in list(self.transfers.items()):
-                if transfer_id.startswith(id_or_token_prefix):
-                    if transfer_obj.status not in [DCCTransferStatus.COMPLETED, DCCTransferStatus.FAILED, DCCTransferStatus.CANCELLED]:
-                        logger.info(f"Cancelling transfer {transfer_id} ('{transfer_obj.filename}') by ID prefix '{id_or_token_prefix}'.")
-                        asyncio.create_task(transfer_obj.cancel(reason))
-                        return True
-                    else:
-                        logger.info(f"Transfer {transfer_id} already {transfer_obj.status.name}, cannot cancel.")
-                        return False
+            for transfer_id in keys_with_prefix(self._sorted_transfer_ids, id_or_token_prefix):
+                transfer_obj = self.transfers[transfer_id]
+                if transfer_obj.status not in TERMINAL_STATUSES:
+                    logger.info(f"Cancelling transfer {transfer_id} ('{transfer_obj.filename}') by ID prefix '{id_or_token_prefix}'.")
+                    asyncio.create_task(transfer_obj.cancel(reason))
+                    return True
+                else:
+                    logger.info(f"Transfer {transfer_id} already {transfer_obj.status.name}, cannot cancel.")
+                    return False
             if self.passive_offer_manager:
-                for token, offer in list(self.passive_offer_manager.pending_offers.items()):
-                    if token.startswith(id_or_token_prefix):
+                for token in self.passive_offer_manager.find_tokens_by_prefix(id_or_token_prefix):
+                    offer = self.passive_offer_manager.pending_offers.get(token)
+                    if offer:
                         transfer_obj = self.transfers.get(offer.transfer_id)
-                        if transfer_obj and transfer_obj.status not in [DCCTransferStatus.COMPLETED, DCCTransferStatus.FAILED, DCCTransferStatus.CANCELLED]:
+                        if transfer_obj and transfer_obj.status not in TERMINAL_STATUSES:
                             logger.info(f"Cancelling transfer {offer.transfer_id} ('{offer.filename}') associated with passive token prefix '{id_or_token_prefix}'.")
                             self.passive_offer_manager.consume_token(token)
                             asyncio.create_task(transfer_obj.cancel(reason + " (passive offer cancelled)"))
@@ -261,7 +270,6 @@ class DCCManager:
 
     def list_transfers_as_dicts(self, status_filter_str: Optional[str] = None) -> List[Dict[str, Any]]:
         self._cleanup_transfers()
-        results = []
         status_enum_filter: Optional[DCCTransferStatus] = None
         if status_filter_str:
             try:
@@ -269,10 +277,14 @@ class DCCManager:
             except KeyError:
                 logger.warning(f"Invalid status filter for list_transfers: '{status_filter_str}'")
         with self._lock:
-            for transfer in self.transfers.values():
-                if status_enum_filter is None or transfer.status == status_enum_filter:
-                    results.append(transfer.get_status_dict())
-        return sorted(results, key=lambda x: x.get("start_time") or float('-inf'), reverse=True)
+            if status_enum_filter is None:
+                selected = list(self.transfers.values())
+            else:
+                selected = [t for t in self.transfers.values() if t.status is status_enum_filter]
+            # Order the transfers themselves (newest first) so status dicts are built once, already in display order.
+            selected.sort(key=_transfer_start_time_key, reverse=True)
+            # Status dicts read rate/ETA state the transfer workers update, so build them under the lock.
+            return [transfer.get_status_dict() for transfer in selected]
 
     def get_local_ip_for_ctcp(self) -> str:
         return get_local_ip_for_ctcp(self.dcc_config, self.dcc_event_logger)
@@ -285,11 +297,12 @@ class DCCManager:
         transfers_to_remove = []
         with self._lock:
             for transfer_id, transfer in self.transfers.items():
-                if transfer.status in [DCCTransferStatus.COMPLETED, DCCTransferStatus.FAILED, DCCTransferStatus.CANCELLED]:
+                if transfer.status in TERMINAL_STATUSES:
                     if transfer.end_time and (now - transfer.end_time) > max_age:
                         transfers_to_remove.append(transfer_id)
             for transfer_id in transfers_to_remove:
                 removed_transfer = self.transfers.pop(transfer_id, None)
+                discard_sorted_key(self._sorted_transfer_ids, transfer_id)
                 if removed_transfer:
                     logger.info(f"Cleaned up old DCC transfer: {transfer_id} ('{removed_transfer.filename}', status: {removed_transfer.status.name})")
         if transfers_to_remove:
@@ -341,7 +354,7 @@ class DCCManager:
         with self._lock:
             transfers_to_cancel = list(self.transfers.values())
         for transfer in transfers_to_cancel:
-            if transfer.status not in [DCCTransferStatus.COMPLETED, DCCTransferStatus.FAILED, DCCTransferStatus.CANCELLED]:
+            if transfer.status not in TERMINAL_STATUSES:
                 logger.info(f"Cancelling transfer {transfer.id} ('{transfer.filename}') due to DCCManager shutdown.")
                 await transfer.cancel("DCC Manager shutting down")
 
@@ -356,4 +369,5 @@ class DCCManager:
         await asyncio.sleep(0.1)
         with self._lock:
             self.transfers.clear()
+            self._sorted_transfer_ids.clear()
         logger.info("DCCManager shutdown complete. All transfers cleared.")
@@ -2,9 +2,12 @@
 import logging
 import time
 import secrets # For generating secure random tokens
+from bisect import insort
 from typing import Dict, Optional, TYPE_CHECKING, List, Any # Added Any
 from datetime import datetime, timezone # Added datetime, timezone
 
+from tirc_core.dcc.dcc_utils import keys_with_prefix, discard_sorted_key
+
 if TYPE_CHECKING:
     from tirc_core.config_defs import DccConfig
 
@@ -33,6 +36,7 @@ class DCCPassiveOfferManager:
     def __init__(self, dcc_config: "DccConfig"):
         self.dcc_config = dcc_config
         self.pending_offers: Dict[str, PassiveOffer] = {} # token -> PassiveOffer
+        self._sorted_tokens: List[str] = [] # Sorted mirror of pending_offers keys for prefix lookups
         logger.info("DCCPassiveOfferManager initialized.")
 
     def generate_token(self, transfer_id: str, peer_nick: str, filename: str, filesize: int) -> str:
@@ -50,6 +54,7 @@ class DCCPassiveOfferManager:
             creation_time=time.monotonic()
         )
         self.pending_offers[token] = offer
+        insort(self._sorted_tokens, token)
         logger.info(f"Generated passive DCC token {token} for transfer {transfer_id} ({filename} to {peer_nick}).")
         return token
 
@@ -60,6 +65,7 @@ class DCCPassiveOfferManager:
             if offer.is_expired(self.dcc_config.passive_mode_token_timeout):
                 logger.warning(f"Passive DCC offer with token {token} has expired. Removing.")
                 del self.pending_offers[token]
+                discard_sorted_key(self._sorted_tokens, token)
                 return None
             return offer
         return None
@@ -70,6 +76,7 @@ class DCCPassiveOfferManager:
         """
         offer = self.pending_offers.pop(token, None)
         if offer:
+            discard_sorted_key(self._sorted_tokens, token)
             if offer.is_expired(self.dcc_config.passive_mode_token_timeout):
                 logger.warning(f"Passive DCC token {token} was consumed but had already expired.")
             logger.info(f"Consumed passive DCC token {token} for transfer {offer.transfer_id}.")
@@ -87,10 +94,15 @@ class DCCPassiveOfferManager:
         for token in expired_tokens:
             offer = self.pending_offers.pop(token, None)
             if offer:
+                discard_sorted_key(self._sorted_tokens, token)
                 logger.info(f"Cleaned up expired passive DCC offer token {token} for transfer {offer.transfer_id} ({offer.filename}).")
         if expired_tokens:
             logger.info(f"Passive offer cleanup: Removed {len(expired_tokens)} expired offers.")
 
+    def find_tokens_by_prefix(self, prefix: str) -> List[str]:
+        """Returns pending tokens starting with prefix, in sorted order."""
+        return keys_with_prefix(self._sorted_tokens, prefix)
+
     def get_pending_offers_for_peer(self, peer_nick: str) -> List[PassiveOffer]:
         """Returns a list of non-expired pending offers for a specific peer."""
         self.cleanup_expired_offers()
@@ -132,6 +144,7 @@ class DCCPassiveOfferManager:
     def shutdown(self):
         logger.info("Shutting down DCCPassiveOfferManager. Clearing all pending offers.")
         self.pending_offers.clear()
+        self._sorted_tokens.clear()
         logger.info("DCCPassiveOfferManager shutdown complete.")
 
 from datetime import timedelta # Add timedelta import at the end or top
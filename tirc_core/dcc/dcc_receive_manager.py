@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Optional, Dict, Any, Deque
 from collections import deque
 from pathlib import Path
 
-from tirc_core.dcc.dcc_transfer import DCCTransfer, DCCTransferType, DCCTransferStatus
+from tirc_core.dcc.dcc_transfer import DCCTransfer, DCCTransferType, DCCTransferStatus, TERMINAL_STATUSES
 from tirc_core.dcc.dcc_utils import ip_str_to_int, format_dcc_ctcp, create_listening_socket
 from tirc_core.dcc.dcc_security import get_safe_download_filepath, sanitize_filename
 from tirc_core.config_defs import DccConfig
@@ -19,6 +19,9 @@ logger = logging.getLogger("tirc.dcc.receive_manager")
 
 class DCCReceiveTransfer(DCCTransfer):
     """Represents an incoming DCC SEND transfer (we are receiving)."""
+
+    __slots__ = ("listening_socket", "accept_task")
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if self.type != DCCTransferType.RECEIVE:
@@ -169,6 +172,7 @@ class DCCReceiveTransfer(DCCTransfer):
                 chunk_size = getattr(self.dcc_config, "chunk_size_recv", 4096)
                 throttle_enabled = self.dcc_config.bandwidth_limit_recv_kbps > 0
                 bytes_per_second_limit = self.dcc_config.bandwidth_limit_recv_kbps * 1024 if throttle_enabled else float('inf')
+                read_timeout = self.dcc_config.timeout / 2 or 30
 
                 last_throttle_check_time = time.monotonic()
                 bytes_recv_in_period = 0
@@ -179,7 +183,7 @@ class DCCReceiveTransfer(DCCTransfer):
                         break
                     read_amount = chunk_size
                     try:
-                        chunk = await asyncio.wait_for(self.reader.read(read_amount), timeout=self.dcc_config.timeout / 2 or 30)
+                        chunk = await asyncio.wait_for(self.reader.read(read_amount), timeout=read_timeout)
                     except asyncio.TimeoutError:
                         await self._update_status(DCCTransferStatus.FAILED, "Timeout waiting for data from peer.")
                         return
@@ -208,7 +212,7 @@ class DCCReceiveTransfer(DCCTransfer):
                                 excess_bytes = bytes_recv_in_period - expected_bytes_this_period
                                 time_to_receive_excess_at_limit = excess_bytes / bytes_per_second_limit
                                 if time_to_receive_excess_at_limit > 0:
-                                    self.transfer_logger.debug(f"[{self.id}] Throttling receive for {self.filename}, sleeping for {time_to_receive_excess_at_limit:.3f}s")
+                                    self.transfer_logger.debug("[%s] Throttling receive for %s, sleeping for %.3fs", self.id, self.filename, time_to_receive_excess_at_limit)
                                     await asyncio.sleep(time_to_receive_excess_at_limit)
                             last_throttle_check_time = current_time
                             bytes_recv_in_period = 0
@@ -336,7 +340,7 @@ class DCCReceiveManager:
         logger.info("Shutting down DCCReceiveManager. Cancelling active receive tasks.")
         all_receives = [t for t in self.dcc_manager.transfers.values() if isinstance(t, DCCReceiveTransfer)]
         for transfer in all_receives:
-            if transfer.status not in [DCCTransferStatus.COMPLETED, DCCTransferStatus.FAILED, DCCTransferStatus.CANCELLED]:
+            if transfer.status not in TERMINAL_STATUSES:
                 if transfer.transfer_task and not transfer.transfer_task.done():
                     logger.info(f"Cancelling active receive task during shutdown: {transfer.filename} from {transfer.peer_nick}")
                     await transfer.cancel("Receive manager shutdown (active task)")
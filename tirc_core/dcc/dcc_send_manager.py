@@ -3,11 +3,11 @@ import logging
 import asyncio
 import os
 import time
-from typing import TYPE_CHECKING, List, Dict, Optional, Tuple, Deque, Union # Added Union
+from typing import TYPE_CHECKING, List, Dict, Optional, Set, Tuple, Deque, Union # Added Union
 from pathlib import Path # Added Path
 from collections import deque # For managing send queue per peer
 
-from tirc_core.dcc.dcc_transfer import DCCTransfer, DCCTransferType, DCCTransferStatus
+from tirc_core.dcc.dcc_transfer import DCCTransfer, DCCTransferType, DCCTransferStatus, TERMINAL_STATUSES
 from tirc_core.dcc.dcc_utils import ip_str_to_int, format_dcc_ctcp, create_listening_socket
 
 if TYPE_CHECKING:
@@ -18,6 +18,9 @@ logger = logging.getLogger("tirc.dcc.sendmanager") # Specific logger for this ma
 
 class DCCSendTransfer(DCCTransfer):
     """Represents an outgoing DCC SEND transfer."""
+
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         if self.type != DCCTransferType.SEND:
@@ -226,7 +229,7 @@ class DCCSendTransfer(DCCTransfer):
                                 excess_bytes = bytes_sent_in_period - expected_bytes_this_period
                                 time_to_send_excess_at_limit = excess_bytes / bytes_per_second_limit
                                 if time_to_send_excess_at_limit > 0:
-                                    self.transfer_logger.debug(f"[{self.id}] Throttling send for {self.filename}, sleeping for {time_to_send_excess_at_limit:.3f}s")
+                                    self.transfer_logger.debug("[%s] Throttling send for %s, sleeping for %.3fs", self.id, self.filename, time_to_send_excess_at_limit)
                                     await asyncio.sleep(time_to_send_excess_at_limit)
 
                             # Reset for next period
@@ -298,6 +301,8 @@ class DCCSendManager:
         # TODO: Define max_concurrent_sends_per_peer in DccConfig in config_defs.py and AppConfig
         self.max_concurrent_sends_per_peer = getattr(self.config, "max_concurrent_sends_per_peer", 2)
         self._lock = asyncio.Lock() # To protect access to queues and active counts
+        self._peers_needing_queue_scan: Set[str] = set() # Peers whose queue is due a scan on the next drain
+        self._queue_scan_pending = False
         logger.info("DCCSendManager initialized.")
 
     async def queue_send_request(
@@ -396,13 +401,36 @@ class DCCSendManager:
             await transfer_to_process._update_status(DCCTransferStatus.QUEUED)
 
         # Process queue for this peer
-        asyncio.create_task(self._process_send_queue(peer_nick))
+        self._schedule_send_queue_scan(peer_nick)
         return transfer_to_process
 
 
+    def _schedule_send_queue_scan(self, peer_nick: str):
+        """Marks a peer's queue for processing; all marked peers are drained by one task per loop tick."""
+        self._peers_needing_queue_scan.add(peer_nick)
+        if not self._queue_scan_pending:
+            self._queue_scan_pending = True
+            asyncio.create_task(self._drain_send_queue_scans())
+
+    async def _drain_send_queue_scans(self):
+        self._queue_scan_pending = False
+        peers = list(self._peers_needing_queue_scan)
+        self._peers_needing_queue_scan = set()
+        for index, peer_nick in enumerate(peers):
+            try:
+                await self._process_send_queue(peer_nick)
+            except asyncio.CancelledError:
+                # Keep the unprocessed peers marked so the next scheduled drain still covers them.
+                self._peers_needing_queue_scan.update(peers[index:])
+                raise
+            except Exception as e:
+                # One peer's failure must not strand the queues of the peers after it.
+                logger.error(f"Error processing send queue for {peer_nick}: {e}", exc_info=True)
+
     async def _process_send_queue(self, peer_nick: str):
         async with self._lock:
-            if peer_nick not in self.send_queues or not self.send_queues[peer_nick]:
+            queue = self.send_queues.get(peer_nick)
+            if not queue:
                 logger.debug(f"Send queue for {peer_nick} is empty. Nothing to process.")
                 return
 
@@ -411,10 +439,19 @@ class DCCSendManager:
                 logger.info(f"Max concurrent sends ({self.max_concurrent_sends_per_peer}) reached for {peer_nick}. Waiting.")
                 return
 
-            transfer = self.send_queues[peer_nick].popleft()
-            self.active_sends_for_peer[peer_nick] = current_active_sends + 1
-            logger.info(f"Processing next send for {peer_nick}: {transfer.filename} (ID: {transfer.id}). Active sends: {self.active_sends_for_peer[peer_nick]}")
+            # Fill every free slot in one pass; several completions may have been coalesced into this scan.
+            to_start: List[DCCSendTransfer] = []
+            while queue and current_active_sends < self.max_concurrent_sends_per_peer:
+                to_start.append(queue.popleft())
+                current_active_sends += 1
+            self.active_sends_for_peer[peer_nick] = current_active_sends
+            for transfer in to_start:
+                logger.info(f"Processing next send for {peer_nick}: {transfer.filename} (ID: {transfer.id}). Active sends: {current_active_sends}")
+
+        for transfer in to_start:
+            asyncio.create_task(self._start_queued_send(peer_nick, transfer))
 
+    async def _start_queued_send(self, peer_nick: str, transfer: DCCSendTransfer):
         try:
             # Start the transfer (this will handle active/passive logic internally)
             # The transfer.start() method is responsible for its own lifecycle now.
@@ -432,7 +469,7 @@ class DCCSendManager:
             async with self._lock:
                 self.active_sends_for_peer[peer_nick] = self.active_sends_for_peer.get(peer_nick, 1) -1
             # Try to process next if any
-            asyncio.create_task(self._process_send_queue(peer_nick))
+            self._schedule_send_queue_scan(peer_nick)
 
 
     async def handle_transfer_completion(self, transfer: DCCSendTransfer):
@@ -444,14 +481,14 @@ class DCCSendManager:
             logger.info(f"DCC SEND for {transfer.filename} to {peer_nick} completed with status {transfer.status.name}. Active sends for peer: {self.active_sends_for_peer[peer_nick]}")
 
         # Process next in queue for this peer
-        asyncio.create_task(self._process_send_queue(peer_nick))
+        self._schedule_send_queue_scan(peer_nick)
 
     async def shutdown(self):
         logger.info("Shutting down DCCSendManager. Cancelling active send tasks.")
         async with self._lock:
             for peer_nick, queue in self.send_queues.items():
                 for transfer in queue:
-                    if transfer.status not in [DCCTransferStatus.COMPLETED, DCCTransferStatus.FAILED, DCCTransferStatus.CANCELLED]:
+                    if transfer.status not in TERMINAL_STATUSES:
                         logger.info(f"Cancelling queued send: {transfer.filename} to {peer_nick}")
                         await transfer.cancel("Send manager shutdown")
             self.send_queues.clear()
@@ -460,7 +497,7 @@ class DCCSendManager:
             # This requires iterating through all tracked transfers in DCCManager
             all_sends = [t for t in self.dcc_manager.transfers.values() if isinstance(t, DCCSendTransfer)]
             for transfer in all_sends:
-                 if transfer.status not in [DCCTransferStatus.COMPLETED, DCCTransferStatus.FAILED, DCCTransferStatus.CANCELLED]:
+                 if transfer.status not in TERMINAL_STATUSES:
                     if transfer.transfer_task and not transfer.transfer_task.done():
                         logger.info(f"Cancelling active send task during shutdown: {transfer.filename} to {transfer.peer_nick}")
                         await transfer.cancel("Send manager shutdown (active task)")
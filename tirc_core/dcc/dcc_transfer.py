@@ -5,7 +5,7 @@ import logging
 import asyncio
 import hashlib
 from enum import Enum, auto
-from typing import Optional, TYPE_CHECKING, Callable, Any, Dict, Union
+from typing import Optional, TYPE_CHECKING, Callable, Any, Dict, Tuple, Union
 from pathlib import Path
 
 if TYPE_CHECKING:
@@ -34,9 +34,28 @@ class DCCTransferStatus(Enum):
     def __str__(self):
         return self.name
 
+# Statuses after which a transfer is finished; shared by the manager and the send/receive managers.
+TERMINAL_STATUSES = frozenset({
+    DCCTransferStatus.COMPLETED,
+    DCCTransferStatus.FAILED,
+    DCCTransferStatus.CANCELLED,
+})
+
 class DCCTransfer:
     """Base class for DCC transfers (send and receive)."""
 
+    __slots__ = (
+        "id", "type", "_type_name", "peer_nick", "filename", "expected_filesize", "local_filepath",
+        "dcc_manager", "dcc_config",
+        "status", "bytes_transferred", "start_time", "end_time", "error_message",
+        "current_rate_bps", "estimated_eta_seconds",
+        "socket", "reader", "writer", "file_handle",
+        "passive_token", "is_passive", "remote_ip", "remote_port", "resume_offset",
+        "checksum_local", "checksum_remote", "checksum_match", "_checksum_key",
+        "transfer_logger", "dcc_event_logger",
+        "transfer_task", "_last_ack_received_time", "_last_rate_update_time", "_bytes_at_last_rate_update",
+    )
+
     def __init__(
         self,
         transfer_id: str,
@@ -55,6 +74,7 @@ class DCCTransfer:
     ):
         self.id = transfer_id
         self.type = transfer_type
+        self._type_name = transfer_type.name # Cached; included in every status/progress payload
         self.peer_nick = peer_nick
         self.filename = filename
         self.expected_filesize = filesize
@@ -84,6 +104,7 @@ class DCCTransfer:
         self.checksum_local: Optional[str] = None
         self.checksum_remote: Optional[str] = None
         self.checksum_match: Optional[bool] = None
+        self._checksum_key: Optional[Tuple[str, int, int]] = None # (algorithm, size, mtime_ns) that checksum_local was computed for
 
         # Logging
         self.transfer_logger = logger # Main logger for general transfer ops
@@ -108,7 +129,7 @@ class DCCTransfer:
         self._last_rate_update_time: float = 0.0
         self._bytes_at_last_rate_update: int = 0
 
-        self.dcc_event_logger.info(f"[{self.id}] Initialized {self.type.name} for {self.filename} with {self.peer_nick}. Passive: {self.is_passive}, Resume Offset: {self.resume_offset}")
+        self.dcc_event_logger.info("[%s] Initialized %s for %s with %s. Passive: %s, Resume Offset: %s", self.id, self._type_name, self.filename, self.peer_nick, self.is_passive, self.resume_offset)
 
 
     async def _update_status(self, new_status: DCCTransferStatus, error_msg: Optional[str] = None):
@@ -120,10 +141,10 @@ class DCCTransfer:
         if error_msg:
             self.error_message = error_msg
             self.transfer_logger.error(f"[{self.id}] Status -> {new_status.name}. Error: {error_msg} (File: {self.filename})")
-        else:
-            self.transfer_logger.info(f"[{self.id}] Status -> {new_status.name} (File: {self.filename})")
+        elif self.transfer_logger.isEnabledFor(logging.INFO):
+            self.transfer_logger.info(f"[{self.id}] Status {old_status.name} -> {new_status.name} (File: {self.filename})")
 
-        if new_status in [DCCTransferStatus.COMPLETED, DCCTransferStatus.FAILED, DCCTransferStatus.CANCELLED]:
+        if new_status in TERMINAL_STATUSES:
             self.end_time = time.monotonic()
             if self.file_handle:
                 try:
@@ -185,16 +206,25 @@ class DCCTransfer:
         self.checksum_match = (self.checksum_local == self.checksum_remote)
         log_level = logging.INFO if self.checksum_match else logging.WARNING
         self.transfer_logger.log(log_level,
-            f"[{self.id}] Checksum for {self.filename}: Local={self.checksum_local}, Remote={self.checksum_remote}. Match: {self.checksum_match}"
+            "[%s] Checksum for %s: Local=%s, Remote=%s. Match: %s",
+            self.id, self.filename, self.checksum_local, self.checksum_remote, self.checksum_match
         )
         await self.dcc_manager.dispatch_transfer_event("DCC_TRANSFER_CHECKSUM_RESULT", self, {"match": self.checksum_match})
         return self.checksum_match
 
     def _calculate_file_hash(self) -> Optional[str]:
-        if not self.dcc_config.checksum_verify or not self.local_filepath.exists():
+        if not self.dcc_config.checksum_verify:
+            return None
+        try:
+            file_stat = self.local_filepath.stat()
+        except OSError:
             return None
 
         algo_name = self.dcc_config.checksum_algorithm.lower()
+        checksum_key = (algo_name, file_stat.st_size, file_stat.st_mtime_ns)
+        if self.checksum_local and self._checksum_key == checksum_key:
+            # Resumed/retried transfer of an unchanged file; reuse the digest instead of re-reading it.
+            return self.checksum_local
         hasher: Optional[hashlib._Hash] = None # type: ignore[name-defined]
 
         if algo_name == "md5":
@@ -213,7 +243,8 @@ class DCCTransfer:
                 while chunk := f.read(8192): # Read in chunks
                     hasher.update(chunk)
             hex_digest = hasher.hexdigest()
-            self.transfer_logger.info(f"[{self.id}] Calculated local {algo_name} for {self.filename}: {hex_digest}")
+            self._checksum_key = checksum_key
+            self.transfer_logger.info("[%s] Calculated local %s for %s: %s", self.id, algo_name, self.filename, hex_digest)
             return hex_digest
         except Exception as e:
             self.transfer_logger.error(f"[{self.id}] Error calculating local hash for {self.filename}: {e}")
@@ -260,7 +291,7 @@ class DCCTransfer:
             except Exception as e:
                 self.transfer_logger.error(f"[{self.id}] Error closing file handle: {e}")
             self.file_handle = None
-        self.transfer_logger.debug(f"[{self.id}] Sockets and file handle closed.")
+        self.transfer_logger.debug("[%s] Sockets and file handle closed.", self.id)
 
 
     def get_progress_percentage(self) -> float:
@@ -272,7 +303,7 @@ class DCCTransfer:
         self._calculate_rate_and_eta() # Ensure rate/ETA are fresh
         return {
             "id": self.id,
-            "type": self.type.name,
+            "type": self._type_name,
             "status": self.status.name,
             "peer_nick": self.peer_nick,
             "filename": self.filename,
@@ -295,5 +326,5 @@ class DCCTransfer:
         }
 
     def __repr__(self):
-        return (f"<DCCTransfer id={self.id[:8]} type={self.type.name} "
+        return (f"<DCCTransfer id={self.id[:8]} type={self._type_name} "
                 f"file='{self.filename}' status={self.status.name} peer={self.peer_nick}>")
@@ -3,7 +3,8 @@ import socket
 import logging
 import ipaddress
 import re # Added import for re
-from typing import Optional, Tuple, Dict, Any
+from bisect import bisect_left
+from typing import Optional, Tuple, Dict, Any, List
 
 from tirc_core.config_defs import DccConfig
 
@@ -176,3 +177,19 @@ def ip_int_to_str(ip_int: int) -> str:
     except ValueError:
         logger.error(f"Invalid IP integer for conversion to str: {ip_int}")
         return "0.0.0.0"
+
+def keys_with_prefix(sorted_keys: List[str], prefix: str) -> List[str]:
+    """Returns the keys in an ascending-sorted list that start with prefix (O(log N + k))."""
+    matches: List[str] = []
+    for i in range(bisect_left(sorted_keys, prefix), len(sorted_keys)):
+        key = sorted_keys[i]
+        if not key.startswith(prefix):
+            break
+        matches.append(key)
+    return matches
+
+def discard_sorted_key(sorted_keys: List[str], key: str) -> None:
+    """Removes key from an ascending-sorted list if present."""
+    i = bisect_left(sorted_keys, key)
+    if i < len(sorted_keys) and sorted_keys[i] == key:
+        del sorted_keys[i]
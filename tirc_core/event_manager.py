@@ -1,7 +1,7 @@
 # event_manager.py
 import logging
 import time
-from typing import TYPE_CHECKING, Dict, Any, Optional, List, Set, Callable
+from typing import TYPE_CHECKING, Dict, Any, Optional, List, Set, Callable, Mapping
 import asyncio
 from tirc_core.dcc.dcc_transfer import DCCTransfer, DCCTransferType # Keep this import
 
@@ -64,6 +64,11 @@ class EventManager:
             logger.debug(f"Attempted to unsubscribe from event '{event_name}' for script '{script_name}', but no subscriptions found for this event.")
 
 
+    def has_listeners(self, event_name: str) -> bool:
+        """Returns True if any handler is subscribed to event_name.
+        Lets hot dispatch paths skip building event payloads nobody will receive."""
+        return event_name in self.subscriptions
+
     def _prepare_base_event_data(self, raw_line: str = "") -> Dict[str, Any]:
         """Prepares a base dictionary with common event data."""
         return {
@@ -96,7 +101,7 @@ class EventManager:
                 hasattr(conn_info, 'nick') and
                 conn_info.nick or "UnknownNick")()
 
-        logger.debug(f"Dispatching event '{event_name}' with data: {final_event_data}")
+        logger.debug("Dispatching event '%s' with data: %s", event_name, final_event_data)
         if event_name in self.subscriptions:
             for subscription in list(self.subscriptions[event_name]):
                 if not subscription.get("enabled", True):
@@ -105,11 +110,12 @@ class EventManager:
                 script_name = subscription["script_name"]
                 try:
                     logger.debug(
-                        f"Calling handler '{getattr(handler, '__name__', 'unknown')}' from script '{script_name}' for event '{event_name}'."
+                        "Calling handler '%s' from script '%s' for event '%s'.",
+                        getattr(handler, '__name__', 'unknown'), script_name, event_name
                     )
                     if asyncio.iscoroutinefunction(handler):
                         asyncio.create_task(handler(final_event_data))
-                        logger.debug(f"Scheduled async event handler '{getattr(handler, '__name__', 'unknown')}' for event '{event_name}' from script '{script_name}'.")
+                        logger.debug("Scheduled async event handler '%s' for event '%s' from script '%s'.", getattr(handler, '__name__', 'unknown'), event_name, script_name)
                     else:
                         handler(final_event_data)
                 except Exception as e:
@@ -128,7 +134,7 @@ class EventManager:
                         f"Disabled event handler '{getattr(handler, '__name__', 'unknown')}' from script '{script_name}' due to error."
                     )
         else:
-            logger.debug(f"No subscriptions found for event '{event_name}'.")
+            logger.debug("No subscriptions found for event '%s'.", event_name)
 
 
     async def dispatch_client_connected(self, server: str, port: int, nick: str, ssl: bool, raw_line: str = ""):
@@ -142,7 +148,7 @@ class EventManager:
     async def dispatch_client_registered(self, nick: str, server_message: str, raw_line: str = ""):
         data = {"nick": nick, "server_message": server_message}
         await self.dispatch_event("CLIENT_REGISTERED", data, raw_line)
-        await self.dispatch_client_ready(nick, raw_line)
+        # CLIENT_READY is dispatched by RegistrationHandler once post-registration and auto-join actions are done.
 
 
     async def dispatch_client_ready(self, nick: str, raw_line: str = ""):
@@ -247,7 +253,7 @@ class EventManager:
     async def dispatch_dcc_transfer_status_change(self, transfer: 'DCCTransfer', raw_line: str = ""):
         data = {
             "transfer_id": transfer.id,
-            "transfer_type": transfer.type.name, # Corrected
+            "transfer_type": transfer._type_name,
             "peer_nick": transfer.peer_nick,
             "filename": transfer.filename,
             "file_size": transfer.expected_filesize, # Corrected
@@ -265,7 +271,7 @@ class EventManager:
     async def dispatch_dcc_transfer_progress(self, transfer: 'DCCTransfer', raw_line: str = ""):
         data = {
             "transfer_id": transfer.id,
-            "transfer_type": transfer.type.name, # Corrected
+            "transfer_type": transfer._type_name,
             "peer_nick": transfer.peer_nick,
             "filename": transfer.filename,
             "file_size": transfer.expected_filesize, # Corrected
@@ -279,7 +285,7 @@ class EventManager:
     async def dispatch_dcc_transfer_checksum_update(self, transfer: 'DCCTransfer', raw_line: str = ""):
         data = {
             "transfer_id": transfer.id,
-            "transfer_type": transfer.type.name, # Corrected
+            "transfer_type": transfer._type_name,
             "peer_nick": transfer.peer_nick,
             "filename": transfer.filename,
             "checksum_local": transfer.checksum_local, # Added
@@ -289,7 +295,7 @@ class EventManager:
         }
         await self.dispatch_event("DCC_TRANSFER_CHECKSUM_UPDATE", data, raw_line)
 
-    async def dispatch_raw_irc_numeric(self, numeric: int, source: Optional[str], params_list: List[str], display_params_list: List[str], trailing: Optional[str], tags: Dict[str, Any], raw_line: str = ""):
+    async def dispatch_raw_irc_numeric(self, numeric: int, source: Optional[str], params_list: List[str], display_params_list: List[str], trailing: Optional[str], tags: Mapping[str, Any], raw_line: str = ""):
         data = {
             "numeric": numeric, "source": source, "params_list": params_list,
             "display_params_list": display_params_list, "trailing": trailing, "tags": tags
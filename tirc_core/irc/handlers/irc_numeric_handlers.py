@@ -1,13 +1,50 @@
 import logging
 import random # Added for random nick generation
 import asyncio # Import asyncio
-from typing import Optional
+from types import MappingProxyType
+from typing import Dict, Optional
 
-from tirc_core.irc.irc_message import IRCMessage
+from tirc_core.irc.irc_message import IRCMessage, irc_casefold
 from tirc_core.context_manager import ChannelJoinStatus
-from tirc_core.state_manager import ConnectionState
+from tirc_core.state_manager import ConnectionInfo, ConnectionState
 
 logger = logging.getLogger("tirc.protocol")
+# Bound once so handlers on NAMES/MOTD bursts skip the global-plus-method lookup per log call.
+_log_info, _log_debug, _log_warning, _log_error = logger.info, logger.debug, logger.warning, logger.error
+
+# Channel membership prefixes that may precede a nick in RPL_NAMREPLY.
+_PREFIX_CHARS = frozenset("@+%&~")
+
+_CHANNEL_JOIN_ERRORS = {
+    471: "is full",
+    473: "is invite-only",
+    474: "you are banned",
+    475: "bad channel key (password)",
+}
+
+_SASL_FAIL_REASONS = {
+    904: "SASL authentication failed",
+    905: "SASL message too long / Base64 decoding error",
+    906: "SASL authentication aborted by server or client",
+}
+
+# Join states that RPL_ENDOFNAMES completes to FULLY_JOINED.
+_PENDING_JOIN_STATES = frozenset({
+    ChannelJoinStatus.SELF_JOIN_RECEIVED,
+    ChannelJoinStatus.JOIN_COMMAND_SENT,
+    ChannelJoinStatus.PENDING_INITIAL_JOIN,
+})
+
+# "[NNN] " display prefixes for every three-digit numeric, built once at import (fixed size).
+_NUMERIC_PREFIXES = tuple(f"[{code:03d}] " for code in range(1000))
+
+
+def _numeric_prefix(parsed_msg: IRCMessage) -> str:
+    code = parsed_msg.code
+    command = parsed_msg.command
+    if code is not None and len(command) == 3 and code < 1000:
+        return _NUMERIC_PREFIXES[code]
+    return f"[{command}] "
 
 
 async def _handle_rpl_welcome(
@@ -16,44 +53,42 @@ async def _handle_rpl_welcome(
     raw_line: str,
     display_params: list,
     trailing: Optional[str],
+    conn_info: Optional[ConnectionInfo],
 ):
     """Handles RPL_WELCOME (001)."""
     params = parsed_msg.params
-    confirmed_nick = params[0] if params else client.nick
+    current_nick = conn_info.nick if conn_info else None
+    confirmed_nick = params[0] if params else current_nick
 
-    if client.nick != confirmed_nick:
-        logger.info(
-            f"RPL_WELCOME: Nick confirmed by server as '{confirmed_nick}', was '{client.nick}'. Updating client.nick."
+    if current_nick != confirmed_nick:
+        _log_info(
+            f"RPL_WELCOME: Nick confirmed by server as '{confirmed_nick}', was '{current_nick}'. Updating client.nick."
         )
-        conn_info = client.state_manager.get_connection_info()
         if conn_info:
             conn_info.nick = confirmed_nick
-            client.state_manager.set("connection_info", conn_info)
-    elif not client.nick and confirmed_nick:
-        conn_info = client.state_manager.get_connection_info()
+    elif not current_nick and confirmed_nick:
         if conn_info:
             conn_info.nick = confirmed_nick
-            client.state_manager.set("connection_info", conn_info)
 
-    server_name = client.server if client and client.server else "the server"
+    server_name = conn_info.server if conn_info and conn_info.server else "the server"
     await client.add_message(
         text=f"Welcome to {server_name}: {trailing if trailing else ''}",
         color_pair_id=client.ui.colors["system_message"],
         context_name="Status",
     )
-    logger.info(f"Received RPL_WELCOME (001). Nick confirmed as {confirmed_nick}.")
+    _log_info(f"Received RPL_WELCOME (001). Nick confirmed as {confirmed_nick}.")
 
-    if hasattr(client, "event_manager") and client.event_manager:
-        client.event_manager.dispatch_client_registered(
-            nick=confirmed_nick,
-            server_message=(trailing if trailing else ""),
-            raw_line=raw_line,
-        )
+    await client.event_manager.dispatch_client_registered(
+        nick=confirmed_nick,
+        server_message=(trailing if trailing else ""),
+        raw_line=raw_line,
+    )
 
-    if hasattr(client, "registration_handler") and client.registration_handler:
-        await client.registration_handler.on_welcome_received(confirmed_nick)
+    registration_handler = client.registration_handler
+    if registration_handler:
+        await registration_handler.on_welcome_received(confirmed_nick)
     else:
-        logger.error(
+        _log_error(
             "RPL_WELCOME received, but client.registration_handler is not initialized."
         )
         await client.add_message(
@@ -62,6 +97,8 @@ async def _handle_rpl_welcome(
             context_name="Status",
         )
 
+_handle_rpl_welcome.wants_conn_info = True
+
 
 async def _handle_rpl_notopic(
     client,
@@ -72,8 +109,10 @@ async def _handle_rpl_notopic(
 ):
     """Handles RPL_NOTOPIC (331)."""
     channel_name = display_params[0] if display_params else "channel"
-    client.context_manager.create_context(channel_name, context_type="channel")
     context = client.context_manager.get_context(channel_name)
+    if context is None:
+        client.context_manager.create_context(channel_name, context_type="channel")
+        context = client.context_manager.get_context(channel_name)
     if context:
         context.topic = None
     await client.add_message(
@@ -93,7 +132,8 @@ async def _handle_rpl_topic(
     """Handles RPL_TOPIC (332)."""
     channel_name = display_params[0] if display_params else "channel"
     topic_text = trailing if trailing else ""
-    client.context_manager.create_context(channel_name, context_type="channel")
+    if client.context_manager.get_context(channel_name) is None:
+        client.context_manager.create_context(channel_name, context_type="channel")
     client.context_manager.update_topic(channel_name, topic_text)
     await client.add_message(
         text=f"Topic for {channel_name}: {topic_text}",
@@ -112,15 +152,18 @@ async def _handle_generic_numeric(
 ):
     """Handles generic or unassigned numeric replies."""
     await client.add_message(
-        text=f"[{parsed_msg.command}] {generic_numeric_msg}",
+        text=_numeric_prefix(parsed_msg) + generic_numeric_msg,
         color_pair_id=client.ui.colors["system_message"],
         context_name="Status",
     )
-    logger.debug(
-        f"Received unhandled/generic numeric {parsed_msg.command}: {raw_line.strip()} (Generic msg: {generic_numeric_msg})"
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        _log_debug(
+            f"Received unhandled/generic numeric {parsed_msg.command}: {raw_line.strip()} (Generic msg: {generic_numeric_msg})"
+        )
     # RPL_ENDOFMOTD (376) logic is now in _handle_motd_and_server_info
 
+_handle_generic_numeric.wants_generic_msg = True
+
 
 async def _handle_rpl_namreply(
     client,
@@ -130,48 +173,51 @@ async def _handle_rpl_namreply(
     trailing: Optional[str],
 ):
     """Handles RPL_NAMREPLY (353)."""
-    logger.debug(f"_handle_rpl_namreply: Called for raw_line='{raw_line.strip()}', display_params={display_params}, trailing='{trailing}'")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        _log_debug(f"_handle_rpl_namreply: Called for raw_line='{raw_line.strip()}', display_params={display_params}, trailing='{trailing}'")
     channel_in_reply = display_params[1] if len(display_params) > 1 else None
     if channel_in_reply:
-        created_for_namreply = client.context_manager.create_context(
-            channel_in_reply,
-            context_type="channel",
-            initial_join_status_for_channel=ChannelJoinStatus.NOT_JOINED,
-        )
-        if created_for_namreply:
-            logger.debug(
-                f"Ensured channel context exists for NAMREPLY: {channel_in_reply} (created with NOT_JOINED)"
-            )
-
+        # Multi-line NAMES bursts hit an existing context after the first line; only create when missing.
         target_ctx_for_names = client.context_manager.get_context(channel_in_reply)
+        if target_ctx_for_names is None:
+            created_for_namreply = client.context_manager.create_context(
+                channel_in_reply,
+                context_type="channel",
+                initial_join_status_for_channel=ChannelJoinStatus.NOT_JOINED,
+            )
+            if created_for_namreply and debug_enabled:
+                _log_debug(
+                    f"Ensured channel context exists for NAMREPLY: {channel_in_reply} (created with NOT_JOINED)"
+                )
+            target_ctx_for_names = client.context_manager.get_context(channel_in_reply)
         if target_ctx_for_names:
+            join_status = target_ctx_for_names.join_status
             if (
-                target_ctx_for_names.join_status
-                == ChannelJoinStatus.PENDING_INITIAL_JOIN
-                or target_ctx_for_names.join_status
-                == ChannelJoinStatus.JOIN_COMMAND_SENT
+                join_status is ChannelJoinStatus.PENDING_INITIAL_JOIN
+                or join_status is ChannelJoinStatus.JOIN_COMMAND_SENT
             ):
                 target_ctx_for_names.join_status = ChannelJoinStatus.SELF_JOIN_RECEIVED
-                logger.debug(
-                    f"NAMREPLY for {channel_in_reply}: Updated join_status to SELF_JOIN_RECEIVED"
-                )
-
-            nicks_on_list = trailing.split() if trailing else []
-            for nick_entry in nicks_on_list:
-                prefix_char = ""
-                actual_nick = nick_entry
-                if nick_entry.startswith(("@", "+", "%", "&", "~")):
-                    prefix_char = nick_entry[0]
-                    actual_nick = nick_entry[1:]
-                client.context_manager.add_user(
-                    channel_in_reply, actual_nick, prefix_char
-                )
+                if debug_enabled:
+                    _log_debug(
+                        f"NAMREPLY for {channel_in_reply}: Updated join_status to SELF_JOIN_RECEIVED"
+                    )
+
+            if trailing:
+                # Build the row as a plain dict so add_users can merge it with one dict.update.
+                new_users: Dict[str, str] = {}
+                for nick_entry in trailing.split():
+                    if nick_entry[0] in _PREFIX_CHARS:
+                        new_users[nick_entry[1:]] = nick_entry[0]
+                    else:
+                        new_users[nick_entry] = ""
+                client.context_manager.add_users(channel_in_reply, new_users)
         else:
-            logger.warning(
+            _log_warning(
                 f"RPL_NAMREPLY: Context {channel_in_reply} not found after create attempt."
             )
     else:
-        logger.warning(f"RPL_NAMREPLY for unknown context. Raw: {raw_line.strip()}")
+        _log_warning(f"RPL_NAMREPLY for unknown context. Raw: {raw_line.strip()}")
 
 
 async def _handle_rpl_endofnames(
@@ -182,50 +228,46 @@ async def _handle_rpl_endofnames(
     trailing: Optional[str],
 ):
     """Handles RPL_ENDOFNAMES (366)."""
-    logger.debug(f"_handle_rpl_endofnames: Called for raw_line='{raw_line.strip()}', display_params={display_params}, trailing='{trailing}'")
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        _log_debug(f"_handle_rpl_endofnames: Called for raw_line='{raw_line.strip()}', display_params={display_params}, trailing='{trailing}'")
     channel_ended = display_params[0] if display_params else "Unknown Channel"
     ctx_for_endofnames = client.context_manager.get_context(channel_ended)
     if ctx_for_endofnames and ctx_for_endofnames.type == "channel":
         user_count = len(ctx_for_endofnames.users)
-        logger.debug(f"NumericHandler._handle_rpl_endofnames: Context for {channel_ended} found. User count: {user_count}. Current join_status: {ctx_for_endofnames.join_status.name if ctx_for_endofnames.join_status else 'N/A'}")
+        if debug_enabled:
+            _log_debug(f"NumericHandler._handle_rpl_endofnames: Context for {channel_ended} found. User count: {user_count}. Current join_status: {ctx_for_endofnames.join_status.name if ctx_for_endofnames.join_status else 'N/A'}")
 
-        if ctx_for_endofnames.join_status in [
-            ChannelJoinStatus.SELF_JOIN_RECEIVED,
-            ChannelJoinStatus.JOIN_COMMAND_SENT,
-            ChannelJoinStatus.PENDING_INITIAL_JOIN,
-        ]:
+        if ctx_for_endofnames.join_status in _PENDING_JOIN_STATES:
             ctx_for_endofnames.join_status = ChannelJoinStatus.FULLY_JOINED
-            logger.info(
+            _log_info(
                 f"NumericHandler._handle_rpl_endofnames: RPL_ENDOFNAMES for {channel_ended}. Set join_status to FULLY_JOINED. User count: {user_count}."
             )
-            conn_info = client.state_manager.get_connection_info()
-            if conn_info:
-                conn_info.currently_joined_channels.add(channel_ended)
-                client.state_manager.set("connection_info", conn_info)
-                logger.info(
-                    f"_handle_rpl_endofnames: Added {channel_ended} to tracked client.currently_joined_channels."
-                )
-            logger.debug(f"_handle_rpl_endofnames: About to call client.handle_channel_fully_joined for {channel_ended}")
+            if debug_enabled:
+                _log_debug(f"_handle_rpl_endofnames: About to call client.handle_channel_fully_joined for {channel_ended}")
             await client.handle_channel_fully_joined(channel_ended)
-            logger.debug(f"_handle_rpl_endofnames: Finished calling client.handle_channel_fully_joined for {channel_ended}")
-        elif ctx_for_endofnames.join_status == ChannelJoinStatus.NOT_JOINED:
-            logger.info(
+            if debug_enabled:
+                _log_debug(f"_handle_rpl_endofnames: Finished calling client.handle_channel_fully_joined for {channel_ended}")
+        elif ctx_for_endofnames.join_status is ChannelJoinStatus.NOT_JOINED:
+            _log_info(
                 f"_handle_rpl_endofnames: RPL_ENDOFNAMES for {channel_ended} (status NOT_JOINED). User count: {user_count}. Not changing join status from this alone, as we weren't in a pending join state."
             )
 
-            logger.info(
-                f"[ENDOFNAMES_DEBUG] About to add user count message for {channel_ended}. Current user count: {user_count}"
-            )
+            if debug_enabled:
+                _log_debug(
+                    f"[ENDOFNAMES_DEBUG] About to add user count message for {channel_ended}. Current user count: {user_count}"
+                )
             await client.add_message(
                 text=f"Users in {channel_ended}: {user_count}",
                 color_pair_id=client.ui.colors.get("system", 0),
                 context_name=channel_ended,
             )
-            logger.info(
-                f"[ENDOFNAMES_DEBUG] Finished adding user count message for {channel_ended}."
-            )
+            if debug_enabled:
+                _log_debug(
+                    f"[ENDOFNAMES_DEBUG] Finished adding user count message for {channel_ended}."
+                )
     else:
-        logger.warning(
+        _log_warning(
             f"RPL_ENDOFNAMES for {channel_ended}, but context not found or not a channel."
         )
         await client.add_message(
@@ -251,6 +293,29 @@ async def _handle_err_nosuchnick(
     )
 
 
+def _mark_join_failed(client, channel_name: str, numeric_label: str):
+    """Marks a channel join as failed: flags the context and releases any pending initial-join wait on it."""
+    failed_join_ctx = client.context_manager.get_context(channel_name)
+    if failed_join_ctx and failed_join_ctx.type == "channel":
+        failed_join_ctx.join_status = ChannelJoinStatus.JOIN_FAILED
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_debug(
+                f"Set join_status to JOIN_FAILED for {channel_name} due to {numeric_label}."
+            )
+    _log_warning(
+        f"{numeric_label} for {channel_name}. Marked as JOIN_FAILED."
+    )
+    # Check if this was an initial join attempt
+    normalized_channel_name = client.context_manager._normalize_context_name(channel_name)
+    pending_initial_joins = client.pending_initial_joins
+    if normalized_channel_name in pending_initial_joins:
+        pending_initial_joins.remove(normalized_channel_name)
+        _log_info(f"{numeric_label}: Removed '{normalized_channel_name}' from pending_initial_joins due to join failure. Remaining: {pending_initial_joins}")
+        if not pending_initial_joins and not client.all_initial_joins_processed.is_set():
+            _log_info(f"{numeric_label}: All initial join attempts (including this failure) processed. Setting all_initial_joins_processed event.")
+            client.all_initial_joins_processed.set()
+
+
 async def _handle_err_nosuchchannel(
     client,
     parsed_msg: IRCMessage,
@@ -267,27 +332,9 @@ async def _handle_err_nosuchchannel(
         color_pair_id=client.ui.colors.get("error_message", 0), # Use .get()
         context_name=target_context_for_message,
     )
-    failed_join_ctx = client.context_manager.get_context(channel_name)
-    if failed_join_ctx and failed_join_ctx.type == "channel":
-        failed_join_ctx.join_status = ChannelJoinStatus.JOIN_FAILED
-        logger.debug(
-            f"Set join_status to JOIN_FAILED for {channel_name} due to ERR_NOSUCHCHANNEL."
-        )
-    conn_info = client.state_manager.get_connection_info()
-    if conn_info:
-        conn_info.currently_joined_channels.discard(channel_name)
-        client.state_manager.set("connection_info", conn_info)
-    logger.warning(
-        f"ERR_NOSUCHCHANNEL (403) for {channel_name}. Marked as JOIN_FAILED and removed from tracked channels."
-    )
-    # Check if this was an initial join attempt
-    normalized_channel_name = client.context_manager._normalize_context_name(channel_name)
-    if hasattr(client, 'pending_initial_joins') and normalized_channel_name in client.pending_initial_joins:
-        client.pending_initial_joins.remove(normalized_channel_name)
-        logger.info(f"ERR_NOSUCHCHANNEL: Removed '{normalized_channel_name}' from pending_initial_joins due to join failure. Remaining: {client.pending_initial_joins}")
-        if not client.pending_initial_joins and hasattr(client, 'all_initial_joins_processed') and not client.all_initial_joins_processed.is_set():
-            logger.info("ERR_NOSUCHCHANNEL: All initial join attempts (including this failure) processed. Setting all_initial_joins_processed event.")
-            client.all_initial_joins_processed.set()
+    _mark_join_failed(client, channel_name, "ERR_NOSUCHCHANNEL (403)")
+
+_handle_err_nosuchchannel.wants_active_context = True
 
 
 async def _handle_err_channel_join_group(
@@ -298,41 +345,15 @@ async def _handle_err_channel_join_group(
     trailing: Optional[str],
 ):
     """Handles grouped channel join errors (471, 473, 474, 475)."""
-    code = int(parsed_msg.command)
+    code = parsed_msg.code
     channel_name = display_params[0] if display_params else "channel"
-    error_message_map = {
-        471: "is full",
-        473: "is invite-only",
-        474: "you are banned",
-        475: "bad channel key (password)",
-    }
-    reason = error_message_map.get(code, "join error")
+    reason = _CHANNEL_JOIN_ERRORS.get(code, "join error")
     await client.add_message(
         text=f"Cannot join {channel_name}: {reason}. {trailing if trailing else ''}",
         color_pair_id=client.ui.colors["error_message"],
         context_name="Status",
     )
-    failed_join_ctx = client.context_manager.get_context(channel_name)
-    if failed_join_ctx and failed_join_ctx.type == "channel":
-        failed_join_ctx.join_status = ChannelJoinStatus.JOIN_FAILED
-        logger.debug(
-            f"Set join_status to JOIN_FAILED for {channel_name} due to {code}."
-        )
-    conn_info = client.state_manager.get_connection_info()
-    if conn_info:
-        conn_info.currently_joined_channels.discard(channel_name)
-        client.state_manager.set("connection_info", conn_info)
-    logger.warning(
-        f"Channel join error {code} for {channel_name}. Marked as JOIN_FAILED."
-    )
-    # Check if this was an initial join attempt
-    normalized_channel_name = client.context_manager._normalize_context_name(channel_name)
-    if hasattr(client, 'pending_initial_joins') and normalized_channel_name in client.pending_initial_joins:
-        client.pending_initial_joins.remove(normalized_channel_name)
-        logger.info(f"ERR_CHANNEL_JOIN_GROUP ({code}): Removed '{normalized_channel_name}' from pending_initial_joins due to join failure. Remaining: {client.pending_initial_joins}")
-        if not client.pending_initial_joins and hasattr(client, 'all_initial_joins_processed') and not client.all_initial_joins_processed.is_set():
-            logger.info(f"ERR_CHANNEL_JOIN_GROUP ({code}): All initial join attempts (including this failure) processed. Setting all_initial_joins_processed event.")
-            client.all_initial_joins_processed.set()
+    _mark_join_failed(client, channel_name, f"ERR_CHANNEL_JOIN_GROUP ({code})")
 
 
 async def _handle_err_nicknameinuse(
@@ -341,78 +362,75 @@ async def _handle_err_nicknameinuse(
     raw_line: str,
     display_params: list,
     trailing: Optional[str],
+    conn_info: Optional[ConnectionInfo],
 ):
     """Handles ERR_NICKNAMEINUSE (433)."""
+    colors = client.ui.colors
     failed_nick = display_params[0] if display_params else client.nick
-    logger.warning(f"ERR_NICKNAMEINUSE (433) for {failed_nick}: {raw_line.strip()}")
+    failed_nick_folded = irc_casefold(failed_nick)
+    _log_warning(f"ERR_NICKNAMEINUSE (433) for {failed_nick}: {raw_line.strip()}")
     await client.add_message(
         text=f"Nickname {failed_nick} is already in use.",
-        color_pair_id=client.ui.colors["error_message"],
+        color_pair_id=colors["error_message"],
         context_name="Status",
     )
 
-    conn_info = client.state_manager.get_connection_info()
     if not conn_info:
-        logger.error("Cannot handle nick collision: no connection info.")
+        _log_error("Cannot handle nick collision: no connection info.")
         return
 
-    if (
-        client.last_attempted_nick_change is not None
-        and client.last_attempted_nick_change.lower() == failed_nick.lower()
-    ):
-        logger.info(
+    if client.last_attempted_nick_change_folded == failed_nick_folded:
+        _log_info(
             f"ERR_NICKNAMEINUSE for user-attempted nick {failed_nick}. Resetting client.last_attempted_nick_change."
         )
         client.last_attempted_nick_change = None
         return  # Don't auto-retry for user-initiated nick changes
 
-    is_our_nick_colliding = conn_info.nick and conn_info.nick.lower() == failed_nick.lower()
+    is_our_nick_colliding = conn_info.nick and irc_casefold(conn_info.nick) == failed_nick_folded
 
     if is_our_nick_colliding and not client.network_handler.is_handling_nick_collision:
-        if hasattr(client, "registration_handler") and client.registration_handler:
+        registration_handler = client.registration_handler
+        if registration_handler:
             current_nick_for_logic = conn_info.nick
-            initial_nick_for_logic = client.registration_handler.initial_nick
+            initial_nick_for_logic = registration_handler.initial_nick
 
-            # Generate a new nickname with a random suffix
-            base_nick = initial_nick_for_logic
-            # Ensure base_nick is not too long before adding suffix
-            if len(base_nick) > 5: # Leave room for a 4-char random suffix
-                base_nick = base_nick[:5]
-            random_suffix = ''.join(random.choices('0123456789abcdef', k=4))
-            new_try_nick = f"{base_nick}-{random_suffix}"
-
-            # Ensure the new nickname isn't too long (IRC limit is typically 9 chars)
-            if len(new_try_nick) > 9:
-                new_try_nick = new_try_nick[:9]
+            # Generate a new nickname with a random suffix: up to 5 chars of the initial nick, a dash and
+            # 4 hex digits, cut to 3 digits when needed to fit the typical 9-char IRC nick limit.
+            base_nick = initial_nick_for_logic[:5]
+            if len(base_nick) < 5:
+                new_try_nick = f"{base_nick}-{random.getrandbits(16):04x}"
+            else:
+                new_try_nick = f"{base_nick}-{random.getrandbits(12):03x}"
 
-            logger.info(f"Nickname {failed_nick} in use, trying {new_try_nick}.")
+            _log_info(f"Nickname {failed_nick} in use, trying {new_try_nick}.")
             await client.add_message(
-                text=f"Trying {new_try_nick} instead.", color_pair_id=client.ui.colors["system_message"], context_name="Status"
+                text=f"Trying {new_try_nick} instead.", color_pair_id=colors["system_message"], context_name="Status"
             )
 
             client.network_handler.is_handling_nick_collision = True
             client.network_handler.send_raw(f"NICK {new_try_nick}")
             conn_info.nick = new_try_nick
-            client.state_manager.set("connection_info", conn_info)
-            client.registration_handler.update_nick_for_registration(new_try_nick)
+            registration_handler.update_nick_for_registration(new_try_nick)
 
             # Also update the nickname in state.json
             client.state_manager._save_state()
         else:
-            logger.warning(
+            _log_warning(
                 "ERR_NICKNAMEINUSE for our nick, but no registration_handler to manage retry."
             )
     elif is_our_nick_colliding and client.network_handler.is_handling_nick_collision:
-        logger.info(
+        _log_info(
             f"ERR_NICKNAMEINUSE for {failed_nick}, but already handling a nick collision. Manual /NICK needed if this fails."
         )
         await client.add_message(
             text="Nickname collision handling failed. Please use /nick to choose a different nickname.",
-            color_pair_id=client.ui.colors["error_message"],
+            color_pair_id=colors["error_message"],
             context_name="Status",
         )
         client.network_handler.is_handling_nick_collision = False
 
+_handle_err_nicknameinuse.wants_conn_info = True
+
 
 async def _handle_sasl_loggedin_success(
     client,
@@ -422,7 +440,7 @@ async def _handle_sasl_loggedin_success(
     trailing: Optional[str],
 ):
     """Handles RPL_LOGGEDIN (900) and RPL_SASLSUCCESS (903)."""
-    code = int(parsed_msg.command)
+    code = parsed_msg.code
     account_name = "your account"
     original_params = parsed_msg.params
     if code == 900 and len(original_params) > 1:
@@ -434,10 +452,11 @@ async def _handle_sasl_loggedin_success(
         else f"SASL authentication successful ({code})."
     )
 
-    if hasattr(client, "sasl_authenticator") and client.sasl_authenticator:
-        client.sasl_authenticator.on_sasl_result_received(True, success_msg)
+    sasl_authenticator = client.sasl_authenticator
+    if sasl_authenticator:
+        sasl_authenticator.on_sasl_result_received(True, success_msg)
     else:
-        logger.error(f"SASL Success ({code}), but no sasl_authenticator on client.")
+        _log_error(f"SASL Success ({code}), but no sasl_authenticator on client.")
         await client.add_message(
             text=f"SASL Success ({code}), but authenticator missing.",
             color_pair_id=client.ui.colors["error_message"],
@@ -453,9 +472,9 @@ async def _handle_sasl_mechanisms(
     trailing: Optional[str],
 ):
     """Handles RPL_SASLMECHS (902) or ERR_SASLMECHS (908)."""
-    code = int(parsed_msg.command)
+    code = parsed_msg.code
     mechanisms = trailing if trailing else "unknown"
-    logger.info(
+    _log_info(
         f"SASL: Server indicated mechanisms: {mechanisms} (Code: {code}). Raw: {raw_line.strip()}"
     )
     await client.add_message(
@@ -471,17 +490,13 @@ async def _handle_sasl_fail_errors(
     trailing: Optional[str],
 ):
     """Handles ERR_SASLFAIL (904), ERR_SASLTOOLONG (905), ERR_SASLABORTED (906)."""
-    code = int(parsed_msg.command)
-    default_reasons = {
-        904: "SASL authentication failed",
-        905: "SASL message too long / Base64 decoding error",
-        906: "SASL authentication aborted by server or client",
-    }
-    reason = trailing if trailing else default_reasons.get(code, f"SASL error ({code})")
-    if hasattr(client, "sasl_authenticator") and client.sasl_authenticator:
-        client.sasl_authenticator.on_sasl_result_received(False, reason)
+    code = parsed_msg.code
+    reason = trailing if trailing else _SASL_FAIL_REASONS.get(code, f"SASL error ({code})")
+    sasl_authenticator = client.sasl_authenticator
+    if sasl_authenticator:
+        sasl_authenticator.on_sasl_result_received(False, reason)
     else:
-        logger.error(f"SASL Failure ({code}), but no sasl_authenticator on client.")
+        _log_error(f"SASL Failure ({code}), but no sasl_authenticator on client.")
         await client.add_message(
             text=f"SASL Error ({code}): {reason}, but authenticator missing.",
             color_pair_id=client.ui.colors["error_message"],
@@ -498,10 +513,11 @@ async def _handle_err_saslalready(
 ):
     """Handles ERR_SASLALREADY (907)."""
     reason = trailing if trailing else "You have already authenticated (907)"
-    if hasattr(client, "sasl_authenticator") and client.sasl_authenticator:
-        client.sasl_authenticator.on_sasl_result_received(True, reason)
+    sasl_authenticator = client.sasl_authenticator
+    if sasl_authenticator:
+        sasl_authenticator.on_sasl_result_received(True, reason)
     else:
-        logger.error("ERR_SASLALREADY (907), but no sasl_authenticator on client.")
+        _log_error("ERR_SASLALREADY (907), but no sasl_authenticator on client.")
         await client.add_message(
             text=f"SASL Warning (907): {reason}, but authenticator missing.",
             color_pair_id=client.ui.colors["system_message"],
@@ -528,6 +544,8 @@ async def _handle_rpl_whoisuser(
     )
     await client.add_message(text=message_to_add, color_pair_id=client.ui.colors["system_message"], context_name=active_context_name) # Changed context
 
+_handle_rpl_whoisuser.wants_active_context = True
+
 
 async def _handle_rpl_endofwhois(
     client,
@@ -544,6 +562,8 @@ async def _handle_rpl_endofwhois(
         text=f"[WHOIS {whois_nick}] End of WHOIS.", color_pair_id=client.ui.colors["system_message"], context_name=active_context_name # Changed context
     )
 
+_handle_rpl_endofwhois.wants_active_context = True
+
 
 async def _handle_motd_and_server_info(
     client,
@@ -555,22 +575,25 @@ async def _handle_motd_and_server_info(
 ):
     """Handles MOTD and various server information numerics."""
     await client.add_message(
-        text=f"[{parsed_msg.command}] {generic_numeric_msg}",
+        text=_numeric_prefix(parsed_msg) + generic_numeric_msg,
         color_pair_id=client.ui.colors["system_message"],
         context_name="Status",
     )
     # Specifically set the end_of_motd_received event if this is RPL_ENDOFMOTD
-    if parsed_msg.command == "376": # RPL_ENDOFMOTD
-        if hasattr(client, "registration_handler") and client.registration_handler:
-            if not client.registration_handler.end_of_motd_received.is_set():
-                logger.info("RPL_ENDOFMOTD (376) received via _handle_motd_and_server_info, setting event.")
-                client.registration_handler.end_of_motd_received.set()
-                logger.info("RPL_ENDOFMOTD (376): Directly triggering post-MOTD actions from _handle_motd_and_server_info.")
-                asyncio.create_task(client.registration_handler.execute_post_motd_actions())
+    if parsed_msg.code == 376: # RPL_ENDOFMOTD
+        registration_handler = client.registration_handler
+        if registration_handler:
+            if not registration_handler.end_of_motd_received.is_set():
+                _log_info("RPL_ENDOFMOTD (376) received via _handle_motd_and_server_info, setting event.")
+                registration_handler.end_of_motd_received.set()
+                _log_info("RPL_ENDOFMOTD (376): Directly triggering post-MOTD actions from _handle_motd_and_server_info.")
+                asyncio.create_task(registration_handler.execute_post_motd_actions())
             else:
-                logger.debug("RPL_ENDOFMOTD (376) received via _handle_motd_and_server_info, but event was already set.")
+                _log_debug("RPL_ENDOFMOTD (376) received via _handle_motd_and_server_info, but event was already set.")
         else:
-            logger.warning("RPL_ENDOFMOTD (376) received via _handle_motd_and_server_info, but no registration_handler.")
+            _log_warning("RPL_ENDOFMOTD (376) received via _handle_motd_and_server_info, but no registration_handler.")
+
+_handle_motd_and_server_info.wants_generic_msg = True
 
 
 async def _handle_rpl_whoreply(
@@ -596,6 +619,8 @@ async def _handle_rpl_whoreply(
     message_to_add = f"[WHO {channel}] {nick} ({user}@{host} on {server_name}) Flags: {flags} - {trailing if trailing else ''}"
     await client.add_message(text=message_to_add, color_pair_id=client.ui.colors["system_message"], context_name=active_context_name) # Changed context
 
+_handle_rpl_whoreply.wants_active_context = True
+
 
 async def _handle_rpl_endofwho(
     client,
@@ -613,6 +638,8 @@ async def _handle_rpl_endofwho(
     )
     await client.add_message(text=message_to_add, color_pair_id=client.ui.colors["system_message"], context_name=active_context_name) # Changed context
 
+_handle_rpl_endofwho.wants_active_context = True
+
 
 async def _handle_rpl_whowasuser(
     client,
@@ -636,6 +663,8 @@ async def _handle_rpl_whowasuser(
     message_to_add = f"[WHOWAS {nick}] User: {user}@{host} Realname: {real_name}"
     await client.add_message(text=message_to_add, color_pair_id=client.ui.colors["system_message"], context_name=active_context_name) # Changed context
 
+_handle_rpl_whowasuser.wants_active_context = True
+
 
 async def _handle_rpl_endofwhowas(
     client,
@@ -653,36 +682,54 @@ async def _handle_rpl_endofwhowas(
     )
     await client.add_message(text=message_to_add, color_pair_id=client.ui.colors["system_message"], context_name=active_context_name) # Changed context
 
+_handle_rpl_endofwhowas.wants_active_context = True
 
-async def _handle_rpl_liststart(
-    client,
-    parsed_msg: IRCMessage,
-    raw_line: str,
-    display_params: list,
-    trailing: Optional[str],
-):
-    """Handles RPL_LISTSTART (321). <client_nick> Channels :Users Name"""
-    # display_params might be empty or contain "Channels"
-    # trailing might be "Users Name" or absent
 
-    active_list_ctx_name = getattr(client, "active_list_context_name", None)
-    target_context_name = "Status"  # Default target
+def _resolve_list_target_context(client, numeric_label: str) -> str:
+    """Returns the context that /list output should go to, resolved once per LIST operation.
+    The result is cached on the client together with the active_list_context_name it was
+    derived from, so each RPL_LIST row skips re-validating it; RPL_LISTEND clears it. A cached list
+    window that has since been closed is re-resolved (falling back to Status)."""
+    active_list_ctx_name = client.active_list_context_name
+    cached = client._list_target_context
+    if cached is not None and cached[0] == active_list_ctx_name:
+        cached_target = cached[1]
+        if cached_target == "Status" or client.context_manager.get_context(cached_target) is not None:
+            return cached_target
 
+    target_context_name = "Status"  # Default target
     if active_list_ctx_name:
         list_ctx = client.context_manager.get_context(active_list_ctx_name)
         if list_ctx and list_ctx.type == "list_results":
             target_context_name = active_list_ctx_name
-            logger.debug(
-                f"RPL_LISTSTART: Active list operation detected. Target context: {target_context_name}"
+            _log_debug(
+                f"{numeric_label}: Active list operation detected. Target context: {target_context_name}"
             )
         elif list_ctx:  # Context exists but is not list_results type
-            logger.warning(
-                f"RPL_LISTSTART: active_list_context_name '{active_list_ctx_name}' exists but is not type 'list_results' (type: {list_ctx.type}). Defaulting to Status."
+            _log_warning(
+                f"{numeric_label}: active_list_context_name '{active_list_ctx_name}' exists but is not type 'list_results' (type: {list_ctx.type}). Defaulting to Status."
             )
         else:  # Context name was set, but context doesn't exist
-            logger.warning(
-                f"RPL_LISTSTART: active_list_context_name '{active_list_ctx_name}' not found. Defaulting to Status."
+            _log_warning(
+                f"{numeric_label}: active_list_context_name '{active_list_ctx_name}' not found. Defaulting to Status."
             )
+    client._list_target_context = (active_list_ctx_name, target_context_name)
+    return target_context_name
+
+
+async def _handle_rpl_liststart(
+    client,
+    parsed_msg: IRCMessage,
+    raw_line: str,
+    display_params: list,
+    trailing: Optional[str],
+):
+    """Handles RPL_LISTSTART (321). <client_nick> Channels :Users Name"""
+    # display_params might be empty or contain "Channels"
+    # trailing might be "Users Name" or absent
+
+    client._list_target_context = None  # A new LIST operation starts; re-resolve its target
+    target_context_name = _resolve_list_target_context(client, "RPL_LISTSTART")
 
     prefix = ""  # No prefix needed if going to its own window
     if target_context_name == "Status":
@@ -709,24 +756,7 @@ async def _handle_rpl_list(
     # display_params[1] is <#_visible>
     # trailing is <topic>
 
-    active_list_ctx_name = getattr(client, "active_list_context_name", None)
-    target_context_name = "Status"  # Default target
-
-    if active_list_ctx_name:
-        list_ctx = client.context_manager.get_context(active_list_ctx_name)
-        if list_ctx and list_ctx.type == "list_results":
-            target_context_name = active_list_ctx_name
-            logger.debug(
-                f"RPL_LIST: Active list operation detected. Target context: {target_context_name}"
-            )
-        elif list_ctx:
-            logger.warning(
-                f"RPL_LIST: active_list_context_name '{active_list_ctx_name}' exists but is not type 'list_results' (type: {list_ctx.type}). Defaulting to Status."
-            )
-        else:
-            logger.warning(
-                f"RPL_LIST: active_list_context_name '{active_list_ctx_name}' not found. Defaulting to Status."
-            )
+    target_context_name = _resolve_list_target_context(client, "RPL_LIST")
 
     prefix = ""  # No prefix needed if going to its own window
     if target_context_name == "Status":
@@ -748,7 +778,8 @@ async def _handle_rpl_listend(
     trailing: Optional[str],
 ):
     """Handles RPL_LISTEND (323). <client_nick> :End of LIST"""
-    active_list_ctx_name = getattr(client, "active_list_context_name", None)
+    colors = client.ui.colors
+    active_list_ctx_name = client.active_list_context_name
     target_context_name_for_message = (
         "Status"  # Default for the main "End of list" message
     )
@@ -757,55 +788,53 @@ async def _handle_rpl_listend(
         list_ctx = client.context_manager.get_context(active_list_ctx_name)
         if list_ctx and list_ctx.type == "list_results":
             target_context_name_for_message = active_list_ctx_name
-            logger.debug(
+            _log_debug(
                 f"RPL_LISTEND: Active list operation detected. Target context: {target_context_name_for_message}"
             )
             # Add specific instructions to the temporary list window
             await client.add_message(
                 text="--- End of /list results ---",
-                color_pair_id=client.ui.colors["system_message"],
+                color_pair_id=colors["system_message"],
                 context_name=target_context_name_for_message,
             )
             await client.add_message(
                 text="This is a temporary window. Type /close or press Ctrl+W to close it.",
-                color_pair_id=client.ui.colors["system_message"],
+                color_pair_id=colors["system_message"],
                 context_name=target_context_name_for_message,
             )
         elif list_ctx:
-            logger.warning(
+            _log_warning(
                 f"RPL_LISTEND: active_list_context_name '{active_list_ctx_name}' exists but is not type 'list_results' (type: {list_ctx.type}). Defaulting to Status for end message."
             )
             await client.add_message(
                 text=f"[List] {trailing if trailing else 'End of channel list.'}",
-                color_pair_id=client.ui.colors["system_message"],
+                color_pair_id=colors["system_message"],
                 context_name="Status",
             )
         else:
-            logger.warning(
+            _log_warning(
                 f"RPL_LISTEND: active_list_context_name '{active_list_ctx_name}' not found. Defaulting to Status for end message."
             )
             await client.add_message(
                 text=f"[List] {trailing if trailing else 'End of channel list.'}",
-                color_pair_id=client.ui.colors["system_message"],
+                color_pair_id=colors["system_message"],
                 context_name="Status",
             )
     else:  # No active_list_context_name was set, so message definitely goes to Status
         await client.add_message(
             text=f"[List] {trailing if trailing else 'End of channel list.'}",
-            color_pair_id=client.ui.colors["system_message"],
+            color_pair_id=colors["system_message"],
             context_name="Status",
         )
 
     # Clear active_list_context_name regardless of where messages went,
     # as the /list server operation is now finished.
-    if (
-        hasattr(client, "active_list_context_name")
-        and client.active_list_context_name is not None
-    ):
-        logger.debug(
-            f"RPL_LISTEND: Clearing active_list_context_name ('{client.active_list_context_name}')."
+    if active_list_ctx_name is not None:
+        _log_debug(
+            f"RPL_LISTEND: Clearing active_list_context_name ('{active_list_ctx_name}')."
         )
         client.active_list_context_name = None
+    client._list_target_context = None
 
 
 async def _handle_err_erroneusnickname(
@@ -819,17 +848,14 @@ async def _handle_err_erroneusnickname(
     # <client> <nick> :Erroneous nickname
     failed_nick = display_params[0] if display_params else "nick"
     error_reason = trailing if trailing else "Erroneous nickname"
-    logger.warning(f"ERR_ERRONEUSNICKNAME (432) for {failed_nick}: {error_reason}")
+    _log_warning(f"ERR_ERRONEUSNICKNAME (432) for {failed_nick}: {error_reason}")
     await client.add_message(
         text=f"Cannot change nick to {failed_nick}: {error_reason}",
         color_pair_id=client.ui.colors["error_message"],
         context_name="Status",
     )
-    if (
-        client.last_attempted_nick_change is not None
-        and client.last_attempted_nick_change.lower() == failed_nick.lower()
-    ):
-        logger.info(
+    if client.last_attempted_nick_change_folded == irc_casefold(failed_nick):
+        _log_info(
             f"ERR_ERRONEUSNICKNAME for user-attempted nick {failed_nick}. Resetting client.last_attempted_nick_change."
         )
         client.last_attempted_nick_change = None
@@ -841,38 +867,41 @@ async def _handle_err_nickcollision(
     raw_line: str,
     display_params: list,
     trailing: Optional[str],
+    conn_info: Optional[ConnectionInfo],
 ):
     """Handles ERR_NICKCOLLISION (436)."""
+    colors = client.ui.colors
     # <client> <nick> :Nickname collision
     collided_nick = display_params[0] if display_params else "nick"
+    collided_nick_folded = irc_casefold(collided_nick)
     error_reason = trailing if trailing else "Nickname collision"
-    logger.warning(f"ERR_NICKCOLLISION (436) for {collided_nick}: {error_reason}")
+    _log_warning(f"ERR_NICKCOLLISION (436) for {collided_nick}: {error_reason}")
     await client.add_message(
         text=f"Cannot change nick to {collided_nick}: {error_reason}. The server killed your nick, attempting to restore to {client.registration_handler.initial_nick}.",
-        color_pair_id=client.ui.colors["error_message"],
+        color_pair_id=colors["error_message"],
         context_name="Status",
     )
-    if (
-        client.last_attempted_nick_change is not None
-        and client.last_attempted_nick_change.lower() == collided_nick.lower()
-    ):
-        logger.info(
+    if client.last_attempted_nick_change_folded == collided_nick_folded:
+        _log_info(
             f"ERR_NICKCOLLISION for user-attempted nick {collided_nick}. Resetting client.last_attempted_nick_change."
         )
         client.last_attempted_nick_change = None
 
     # Attempt to reclaim initial nick or a variant if collision occurs
-    conn_info = client.state_manager.get_connection_info()
-    if conn_info and conn_info.nick.lower() == collided_nick.lower():  # If our current nick is the one that collided
+    if conn_info and irc_casefold(conn_info.nick) == collided_nick_folded:  # If our current nick is the one that collided
         client.network_handler.send_raw(f"NICK {client.registration_handler.initial_nick}") # Use registration_handler.initial_nick
         await client.add_message(
             text=f"Attempting to restore nick to {client.registration_handler.initial_nick}.", # Use registration_handler.initial_nick
-            color_pair_id=client.ui.colors["system_message"],
+            color_pair_id=colors["system_message"],
             context_name="Status",
         )
 
+_handle_err_nickcollision.wants_conn_info = True
 
-NUMERIC_HANDLERS = {
+
+# Read-only: the dense dispatch tables below are built from this once at import, so runtime edits
+# would never reach dispatch.
+NUMERIC_HANDLERS = MappingProxyType({
     1: _handle_rpl_welcome,
     251: _handle_motd_and_server_info,
     252: _handle_motd_and_server_info,
@@ -915,78 +944,89 @@ NUMERIC_HANDLERS = {
     323: _handle_rpl_listend,
     352: _handle_rpl_whoreply,
     369: _handle_rpl_endofwhowas,
-}
+})
+
+
+# Handlers tagged wants_generic_msg, wants_active_context or wants_conn_info take generic_numeric_msg,
+# active_context_name or the dispatcher's ConnectionInfo as a sixth parameter; all others take five.
+
+# Dense per-code tables for the three-digit numeric range; the dispatcher indexes these instead of hashing
+# into NUMERIC_HANDLERS. Unassigned codes map to the generic handler.
+_NUMERIC_CODE_LIMIT = 1000
+_NUMERIC_HANDLERS_BY_CODE = [_handle_generic_numeric] * _NUMERIC_CODE_LIMIT
+for _code, _handler in NUMERIC_HANDLERS.items():
+    _NUMERIC_HANDLERS_BY_CODE[_code] = _handler
+_NEEDS_GENERIC_MSG = [getattr(handler, "wants_generic_msg", False) for handler in _NUMERIC_HANDLERS_BY_CODE]
+_NEEDS_ACTIVE_CONTEXT = [getattr(handler, "wants_active_context", False) for handler in _NUMERIC_HANDLERS_BY_CODE]
+_NEEDS_CONN_INFO = [getattr(handler, "wants_conn_info", False) for handler in _NUMERIC_HANDLERS_BY_CODE]
+del _code, _handler
+
+
+class NumericDispatcher:
+    """Per-client numeric dispatch state; the client's managers are bound once instead of walked per line."""
+
+    __slots__ = ("client", "get_connection_info", "has_listeners", "dispatch_raw_irc_numeric", "_nick", "_nick_lower")
+
+    def __init__(self, client):
+        self.client = client
+        self.get_connection_info = client.state_manager.get_connection_info
+        self.has_listeners = client.event_manager.has_listeners
+        self.dispatch_raw_irc_numeric = client.event_manager.dispatch_raw_irc_numeric
+        # Lowercased copy of the current nick, recomputed only when the nick changes.
+        self._nick = ""
+        self._nick_lower = ""
+
+    async def dispatch(self, parsed_msg: IRCMessage, raw_line: str, active_context_name: str):
+        client = self.client
+        code = parsed_msg.code
+        params = parsed_msg.params
+        trailing = parsed_msg.trailing
+
+        conn_info = self.get_connection_info()
+        current_nick = conn_info.nick if conn_info else ""
+        if current_nick != self._nick:
+            self._nick = current_nick
+            self._nick_lower = current_nick.lower()
+        nick_lower = self._nick_lower
+
+        # Remove client's nick from params for display purposes
+        display_params = [p for p in params if p.lower() != nick_lower]
+
+        # Dispatch RAW_IRC_NUMERIC event; the param copies and tags dict are only built when a script subscribed.
+        if self.has_listeners("RAW_IRC_NUMERIC"):
+            await self.dispatch_raw_irc_numeric(
+                numeric=code,
+                source=parsed_msg.prefix,
+                params_list=list(params),
+                display_params_list=list(display_params),
+                trailing=trailing,
+                tags=parsed_msg.get_all_tags_view(),
+                raw_line=raw_line,
+            )
+
+        # Handle specific numeric replies; unknown numerics fall through to the generic handler.
+        if code < _NUMERIC_CODE_LIMIT:
+            handler = _NUMERIC_HANDLERS_BY_CODE[code]
+            needs_generic_msg = _NEEDS_GENERIC_MSG[code]
+        else:
+            handler = _handle_generic_numeric  # Numerics beyond the dense table's range
+            needs_generic_msg = True
+        if needs_generic_msg:
+            # Only these handlers display the generic text, so it is built here rather than for every numeric.
+            generic_msg = trailing if trailing else " ".join(display_params)
+            await handler(client, parsed_msg, raw_line, display_params, trailing, generic_msg)
+        elif _NEEDS_ACTIVE_CONTEXT[code]:
+            await handler(client, parsed_msg, raw_line, display_params, trailing, active_context_name)
+        elif _NEEDS_CONN_INFO[code]:
+            # Reuse the lookup done above for the nick filter instead of another locked state read.
+            await handler(client, parsed_msg, raw_line, display_params, trailing, conn_info)
+        else:
+            await handler(client, parsed_msg, raw_line, display_params, trailing)
 
 
 async def _handle_numeric_command(client, parsed_msg: IRCMessage, raw_line: str, active_context_name: str): # Added active_context_name
     """Handles numeric commands."""
-    code = int(parsed_msg.command)
-    params = parsed_msg.params
-    trailing = parsed_msg.trailing
-
-    conn_info = client.state_manager.get_connection_info()
-    current_nick = conn_info.nick if conn_info else ""
-
-    # Remove client's nick from params for display purposes
-    display_params = [p for p in params if p.lower() != current_nick.lower()]
-
-    # Dispatch RAW_IRC_NUMERIC event
-    if hasattr(client, "event_manager") and client.event_manager:
-        client.event_manager.dispatch_raw_irc_numeric(
-            numeric=code,
-            source=parsed_msg.prefix,
-            params_list=list(params),
-            display_params_list=list(display_params),
-            trailing=trailing,
-            tags=parsed_msg.get_all_tags(),
-            raw_line=raw_line,
-        )
-
-    # Define generic_msg here so it's always available
-    generic_msg = trailing if trailing else " ".join(display_params)
-
-    # Handle specific numeric replies
-    handler = NUMERIC_HANDLERS.get(code)
-    if handler:
-        if handler:
-            # Determine which arguments to pass based on the handler's expected signature.
-            # This is a more robust way to handle varying argument counts for handlers.
-            # We'll assume handlers either take 5 args (client, parsed_msg, raw_line, display_params, trailing)
-            # or 6 args (adding active_context_name or generic_numeric_msg).
-
-            # List handlers that expect active_context_name (6 arguments)
-            handlers_with_active_context = {
-                _handle_rpl_whoisuser, _handle_rpl_endofwhois,
-                _handle_rpl_whoreply, _handle_rpl_endofwho,
-                _handle_rpl_whowasuser, _handle_rpl_endofwhowas,
-                _handle_rpl_liststart, _handle_rpl_list, _handle_rpl_listend,
-                _handle_err_nosuchnick, _handle_err_nosuchchannel, _handle_err_channel_join_group,
-                _handle_err_nicknameinuse, _handle_err_erroneusnickname, _handle_err_nickcollision,
-                _handle_sasl_loggedin_success, _handle_sasl_mechanisms, _handle_sasl_fail_errors, _handle_err_saslalready,
-            }
-
-            # List handlers that expect generic_numeric_msg (6 arguments)
-            handlers_with_generic_msg = {
-                _handle_motd_and_server_info, _handle_generic_numeric
-            }
-
-            # List handlers that expect only 5 arguments
-            handlers_with_5_args = {
-                _handle_rpl_welcome, _handle_rpl_notopic, _handle_rpl_topic, _handle_rpl_namreply, _handle_rpl_endofnames
-            }
-
-            if handler in handlers_with_active_context:
-                await handler(client, parsed_msg, raw_line, display_params, trailing, active_context_name)
-            elif handler in handlers_with_generic_msg:
-                await handler(client, parsed_msg, raw_line, display_params, trailing, generic_msg)
-            elif handler in handlers_with_5_args:
-                await handler(client, parsed_msg, raw_line, display_params, trailing)
-            else:
-                # Fallback for any handler not explicitly categorized, should ideally not be hit
-                logger.warning(f"Numeric handler {handler.__name__} not explicitly categorized by argument count. Falling back to generic numeric handler.")
-                await _handle_generic_numeric(client, parsed_msg, raw_line, display_params, trailing, generic_msg)
-        else:
-            # Generic numeric reply if no specific handler is found in NUMERIC_HANDLERS
-            await _handle_generic_numeric(
-                client, parsed_msg, raw_line, display_params, trailing, generic_msg
-            )
+    dispatcher = client._numeric_dispatcher
+    if dispatcher is None:
+        dispatcher = client._numeric_dispatcher = NumericDispatcher(client)
+    await dispatcher.dispatch(parsed_msg, raw_line, active_context_name)
@@ -1,9 +1,20 @@
 import re
-from typing import Optional, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping
 IRC_MSG_RE = re.compile(
     r'^(?::(?P<prefix>[^ ]+) )?(?P<command>[^ ]+)(?: *(?P<params>[^:]*))?(?: *:(?P<trailing>.*))?$'
 )
 
+# RFC 1459 casemapping: besides ASCII letters, []\~ are the uppercase forms of {}|^.
+_RFC1459_CASEFOLD_TABLE = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ[]\\~", "abcdefghijklmnopqrstuvwxyz{}|^"
+)
+
+
+def irc_casefold(name: str) -> str:
+    """Folds a nick or channel name for case-insensitive comparison (RFC 1459 casemapping)."""
+    return name.translate(_RFC1459_CASEFOLD_TABLE)
+
 
 def unescape_tag_value(value: str) -> str:
     """Unescape an IRCv3 tag value according to the spec."""
@@ -27,6 +38,10 @@ class IRCMessage:
     ):
         self.prefix = prefix
         self.command = command
+        # Numeric replies are exactly three ASCII digits; anything else is routed as a named command.
+        self.code: Optional[int] = (
+            int(command) if command and len(command) == 3 and command.isascii() and command.isdigit() else None
+        )
         self.params_str = params_str.strip() if params_str else None
         self.trailing = trailing
         self.params = (
@@ -76,3 +91,7 @@ class IRCMessage:
     def get_all_tags(self) -> Dict[str, str]:
         """Get all message tags."""
         return self.tags.copy()
+
+    def get_all_tags_view(self) -> Mapping[str, str]:
+        """Get a read-only view of the message tags without copying them; use dict() for a mutable copy."""
+        return MappingProxyType(self.tags)
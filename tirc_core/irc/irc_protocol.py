@@ -70,7 +70,7 @@ async def handle_server_message(client: "IRCClient_Logic", raw_line: str):
             await handler(client, parsed_msg, raw_line, list(params), trailing)
         except Exception as e:
             logger.error(f"Error in handler for command {command_upper}: {e}", exc_info=True)
-    elif command_upper.isdigit():
+    elif parsed_msg.code is not None: # Numeric reply; the parser already converted the code
         try:
             await irc_numeric_handlers._handle_numeric_command(client, parsed_msg, raw_line, active_context_name)
         except Exception as e:
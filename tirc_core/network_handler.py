@@ -318,6 +318,7 @@ class NetworkHandler:
                     self.logger.warning("Could not dispatch disconnect event: server/port info missing.")
 
         self.buffer = b""
+        self.client_logic_ref._list_target_context = None # An interrupted /list must not leak into the next session
         self.logger.debug("Connection state reset complete")
 
     async def _connect_socket(self) -> bool:
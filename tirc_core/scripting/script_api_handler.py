@@ -186,6 +186,16 @@ class ScriptAPIHandler:
             **kwargs # Pass through other kwargs
         )
 
+    async def add_messages_to_context(
+        self,
+        context_name: str,
+        lines: List[str],
+        color_key: str = "system",
+    ) -> None:
+        """Adds several lines to a context in one batch (one context lookup, one UI refresh)."""
+        color_pair_id = self.client_logic.ui.colors.get(color_key, self.client_logic.ui.colors.get("system", 0))
+        await self.client_logic.add_messages(lines, color_pair_id, context_name)
+
     # --- Information Retrieval ---
     def get_client_nick(self) -> Optional[str]:
         conn_info = self.client_logic.state_manager.get_connection_info()
@@ -215,8 +225,7 @@ class ScriptAPIHandler:
 
     def get_joined_channels(self) -> Set[str]:
         """Returns a set of currently joined channel names."""
-        conn_info = self.client_logic.state_manager.get_connection_info()
-        return conn_info.currently_joined_channels.copy() if conn_info else set()
+        return self.client_logic.context_manager.get_joined_channels()
 
     def get_context_info(self, context_name: str) -> Optional[Dict[str, Any]]:
         """
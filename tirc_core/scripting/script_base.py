@@ -1,10 +1,14 @@
 import os
 import asyncio # Import asyncio
-from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Any, Set
+from typing import TYPE_CHECKING, List, Optional, Tuple, Dict, Any, Set, Sequence
 
 if TYPE_CHECKING:
     from tirc_core.scripting.script_api_handler import ScriptAPIHandler
 
+# Parsed data files shared across script instances and reloads: path -> ((st_mtime_ns, st_size), items).
+# An entry is reused only while the file's stat key is unchanged, so edited files are re-read.
+_DATA_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Tuple[str, ...]]] = {}
+
 
 class ScriptBase:
     """Base class for all tIRC scripts.
@@ -83,13 +87,14 @@ class ScriptBase:
         )
         return data_dir_path
 
-    async def load_list_from_data_file(self, filename: str, default_items: list) -> list:
+    async def load_list_from_data_file(self, filename: str, default_items: Sequence[str]) -> list:
         """Load a list of items from a data file or return default items if file not found/empty.
         This method is now asynchronous and uses asyncio.to_thread for file operations.
+        Parsed contents are cached per path and reused until the file's mtime or size changes.
 
         Args:
             filename: The name of the data file to load
-            default_items: List of default items to return if file not found/empty
+            default_items: Default items (list or tuple) to return, as a new list, if file not found/empty
 
         Returns:
             list: The loaded items or default_items if file not found/empty
@@ -98,12 +103,18 @@ class ScriptBase:
         try:
             file_path = self.api.request_data_file_path(filename)
 
-            file_exists = await asyncio.to_thread(os.path.exists, file_path)
-            if not file_exists:
+            try:
+                stat_result = await asyncio.to_thread(os.stat, file_path)
+            except FileNotFoundError:
                 self.api.log_warning(
                     f"Data file '{filename}' not found at '{file_path}'. Using default items."
                 )
-                return default_items.copy()
+                return list(default_items)
+
+            cache_key = (stat_result.st_mtime_ns, stat_result.st_size)
+            cached = _DATA_FILE_CACHE.get(file_path)
+            if cached is not None and cached[0] == cache_key:
+                return list(cached[1])
 
             def _read_file_sync():
                 _items = []
@@ -117,8 +128,9 @@ class ScriptBase:
                 self.api.log_warning(
                     f"Data file '{filename}' is empty. Using default items."
                 )
-                return default_items.copy()
+                return list(default_items)
 
+            _DATA_FILE_CACHE[file_path] = (cache_key, tuple(items))
             self.api.log_info(
                 f"Successfully loaded {len(items)} items from '{filename}'."
             )
@@ -127,7 +139,7 @@ class ScriptBase:
             self.api.log_error(
                 f"Error loading data file '{filename}': {e}. Using default items."
             )
-            return default_items.copy()
+            return list(default_items)
 
     def get_enabled_caps(self) -> Set[str]:
         """Get the set of currently enabled capabilities from the cap negotiator.
@@ -139,19 +151,8 @@ class ScriptBase:
             return self.api.client_logic.cap_negotiator.get_enabled_caps()
         return set()
 
-    async def ensure_command_args(
-        self, args_str: str, command_name: str, num_expected_parts: int = 1
-    ) -> Optional[List[str]]:
-        """Helper method to validate command arguments and display usage message if needed.
-
-        Args:
-            args_str: The raw arguments string from the command
-            command_name: The name of the command (used to fetch help text)
-            num_expected_parts: The number of space-separated parts expected in args_str
-
-        Returns:
-            Optional[List[str]]: List of argument parts if valid, None if invalid
-        """
+    def _get_command_usage(self, command_name: str) -> str:
+        """Returns the usage line registered for a command, or a bare "Usage: /<command>"."""
         # Get help text for the command
         help_data = self.api.client_logic.command_handler.get_help_text_for_command(command_name)
 
@@ -172,13 +173,54 @@ class ScriptBase:
                     if usage_from_help:
                         usage_msg = usage_from_help
             # If 'usage' is not in help_data, or is empty, usage_msg remains default_usage
+        return usage_msg
+
+    async def _show_command_usage(self, command_name: str) -> None:
+        """Shows a command's usage line as an error in the current context."""
+        await self.api.add_message_to_context(
+            self.api.get_current_context_name() or "Status",
+            self._get_command_usage(command_name),
+            "error",
+        )
+
+    async def ensure_command_args(
+        self, args_str: str, command_name: str, num_expected_parts: int = 1
+    ) -> Optional[List[str]]:
+        """Helper method to validate command arguments and display usage message if needed.
 
+        Args:
+            args_str: The raw arguments string from the command
+            command_name: The name of the command (used to fetch help text)
+            num_expected_parts: The number of space-separated parts expected in args_str
+
+        Returns:
+            Optional[List[str]]: List of argument parts if valid, None if invalid
+        """
         # Split args and check count
         parts = args_str.strip().split()
         if len(parts) < num_expected_parts:
-            await self.api.add_message_to_context(
-                self.api.get_current_context_name() or "Status", usage_msg, "error"
-            )
+            await self._show_command_usage(command_name)
             return None
 
         return parts
+
+    async def ensure_command_args_raw(
+        self, args_str: str, command_name: str, num_expected_parts: int = 1
+    ) -> Optional[str]:
+        """Like ensure_command_args, but for commands that use their arguments as one piece of text.
+
+        Args:
+            args_str: The raw arguments string from the command
+            command_name: The name of the command (used to fetch help text)
+            num_expected_parts: The minimum number of space-separated parts expected in args_str
+
+        Returns:
+            Optional[str]: The stripped argument string if valid, None if invalid
+        """
+        text = args_str.strip()
+        # maxsplit stops the scan once enough parts are found; no full token list is built
+        if num_expected_parts > 0 and len(text.split(None, num_expected_parts - 1)) < num_expected_parts:
+            await self._show_command_usage(command_name)
+            return None
+
+        return text
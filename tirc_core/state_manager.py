@@ -10,7 +10,7 @@ logger.debug(f"Loading StateManager from: {os.path.abspath(__file__)}")
 import os
 import logging
 import dataclasses
-from typing import Any, Dict, List, Optional, Set, Callable, TypeVar, Generic, Union
+from typing import Any, Dict, List, Optional, Callable, TypeVar, Generic, Union
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from enum import Enum, auto
@@ -88,7 +88,6 @@ class ConnectionInfo:
         last_successful_connection (Optional[datetime]): Timestamp of the last successful connection.
         config_errors (List[str]): List of configuration validation errors.
         user_modes (List[str]): Current user modes (e.g., '+i', '+w').
-        currently_joined_channels (Set[str]): Set of channels currently joined.
         last_attempted_nick_change (Optional[str]): The last nickname attempted to change to.
     """
     server: str
@@ -113,7 +112,6 @@ class ConnectionInfo:
     last_successful_connection: Optional[datetime] = None
     config_errors: List[str] = field(default_factory=list)
     user_modes: List[str] = field(default_factory=list)
-    currently_joined_channels: Set[str] = field(default_factory=set)
     last_attempted_nick_change: Optional[str] = None
 
 
@@ -317,9 +315,8 @@ class StateManager:
                         if time_field in conn_info and conn_info[time_field] is not None:
                             conn_info[time_field] = datetime.fromisoformat(conn_info[time_field])
 
-                    # Explicitly convert lists back to sets for fields that are defined as sets
-                    if "currently_joined_channels" in conn_info and isinstance(conn_info["currently_joined_channels"], list):
-                        conn_info["currently_joined_channels"] = set(conn_info["currently_joined_channels"])  # type: ignore
+                    # Joined channels are now derived from channel contexts; drop the field from older state files
+                    conn_info.pop("currently_joined_channels", None)
                     # Re-create the ConnectionInfo dataclass from the dictionary
                     loaded_data["connection_info"] = ConnectionInfo(**conn_info)
                 except (TypeError, KeyError, ValueError) as e: